@@ -1,17 +1,21 @@
 import os
 import subprocess
 import rumps
+from PyObjCTools.AppHelper import callAfter
 
 from macos_picker import pick_folder
-from scanner import scan_project, SCAN_DEV, SCAN_PROD
-from report_html import write_html_report
+from scanner import SCAN_DEV, SCAN_PROD
+from scan_job import ScanJob
 from install_hook import install_precommit_hook
 from settings_ui import (
     open_general_settings,
     open_ignore_settings,
 )
-from config import load_config
+from config import config_snapshot
 from ipc import (
+    MSG_COMMAND,
+    connected,
+    subscribe,
     read_command,
     clear_command,
     write_status,
@@ -54,6 +58,10 @@ class ZinkxDevAssistant(rumps.App):
         self.last_risks = 0
         self.last_todos = 0
 
+        # Arka plan taraması + tarama sürerken gelen son istek (coalesce)
+        self._job: ScanJob | None = None
+        self._queued_scan: tuple[str, str] | None = None
+
         # --------------------------------------------------
         # Settings submenu
         # --------------------------------------------------
@@ -77,6 +85,7 @@ class ZinkxDevAssistant(rumps.App):
             rumps.MenuItem("Scan (Default Mode)", callback=self.scan_default),
             rumps.MenuItem("Scan (Dev Mode)", callback=self.scan_dev),
             rumps.MenuItem("Scan (Prod Mode)", callback=self.scan_prod),
+            rumps.MenuItem("Cancel Scan"),      # tarama sürerken aktif
             rumps.MenuItem("Open Last Report", callback=self.open_last_report),
             None,
             settings_menu,
@@ -93,8 +102,12 @@ class ZinkxDevAssistant(rumps.App):
         # --------------------------------------------------
         # IPC command listener (Qt → Menu Bar)
         # --------------------------------------------------
-        self._cmd_timer = rumps.Timer(self._poll_commands, 1)
-        self._cmd_timer.start()
+        if connected():
+            # launcher kanalı: mesaj gelince main thread'de işlenir
+            subscribe(MSG_COMMAND, lambda cmd: callAfter(self._handle_command, cmd))
+        else:
+            self._cmd_timer = rumps.Timer(self._poll_commands, 1)
+            self._cmd_timer.start()
 
     # --------------------------------------------------
     # IPC
@@ -105,7 +118,9 @@ class ZinkxDevAssistant(rumps.App):
             return
 
         clear_command()
+        self._handle_command(cmd)
 
+    def _handle_command(self, cmd):
         action = cmd.get("action")
         mode = cmd.get("mode")
         project = cmd.get("project")
@@ -118,12 +133,6 @@ class ZinkxDevAssistant(rumps.App):
                 SCAN_PROD if mode == "prod" else SCAN_DEV
             )
 
-            write_status({
-                "last_risks": self.last_risks,
-                "last_todos": self.last_todos,
-                "mode": mode,
-            })
-
     # --------------------------------------------------
     # Menu → Qt
     # --------------------------------------------------
@@ -136,7 +145,7 @@ class ZinkxDevAssistant(rumps.App):
     # Badge / Menu State
     # --------------------------------------------------
     def _update_title_badge(self):
-        cfg = load_config()
+        cfg = config_snapshot()
         threshold = int(cfg.get("risk_threshold", 0))
 
         if self.last_risks > threshold:
@@ -147,7 +156,7 @@ class ZinkxDevAssistant(rumps.App):
             self.title = "Zinkx ✔"
 
     def _refresh_mode_checks(self):
-        cfg = load_config()
+        cfg = config_snapshot()
         mode = cfg.get("default_mode", "dev")
 
         self.menu["Scan (Dev Mode)"].state = 0
@@ -200,7 +209,7 @@ class ZinkxDevAssistant(rumps.App):
         rumps.notification("Zinkx", "Project Selected", chosen)
 
     def scan_default(self, _):
-        cfg = load_config()
+        cfg = config_snapshot()
         mode = cfg.get("default_mode", "dev")
         self._scan_with_mode(SCAN_PROD if mode == "prod" else SCAN_DEV)
 
@@ -218,31 +227,74 @@ class ZinkxDevAssistant(rumps.App):
             rumps.alert("No project selected", "Choose Project Folder first.")
             return
 
-        findings = scan_project(self.project_root, mode=mode)
-        report_path = write_html_report(
-            findings,
-            self.project_root,
-            out_dir="reports",
-        )
-        self._save_last_report(str(report_path))
+        request = (self.project_root, mode)
 
-        risks = sum(1 for f in findings if f.kind == "RISK")
-        todos = sum(1 for f in findings if f.kind == "TODO")
+        if self._job and self._job.is_running():
+            # Tarama sürüyor: sadece en son istek bekler (tekrarlar tek taramaya iner)
+            self._queued_scan = request
+            return
 
-        self.last_risks = risks
-        self.last_todos = todos
-        self._update_title_badge()
-        self._refresh_mode_checks()
+        self._start_scan(*request)
 
-        label = "PROD" if mode == SCAN_PROD else "DEV"
+    def _start_scan(self, project: str, mode: str):
+        self._job = ScanJob(
+            project,
+            mode,
+            on_done=lambda job: callAfter(self._on_scan_done, job),
+        ).start()
 
-        rumps.notification(
-            "Zinkx",
-            f"Scan Complete ({label})",
-            f"Risks: {risks} | TODO: {todos}",
-        )
+        self.title = "Zinkx ⏳"
+        self.menu["Cancel Scan"].set_callback(self.cancel_scan)
+
+    def cancel_scan(self, _):
+        self._queued_scan = None
+        if self._job and self._job.is_running():
+            self._job.cancel()
+
+    def _on_scan_done(self, job: ScanJob):
+        # Main thread (callAfter)
+        self.menu["Cancel Scan"].set_callback(None)
+        label = "PROD" if job.mode == SCAN_PROD else "DEV"
+
+        if job.cancelled:
+            write_status({"type": "cancelled", "mode": job.mode})
+            self._update_title_badge()
+            rumps.notification("Zinkx", f"Scan Cancelled ({label})", job.project)
+
+        elif job.error is not None:
+            write_status({"type": "failed", "mode": job.mode, "error": str(job.error)})
+            self._update_title_badge()
+            rumps.alert("Scan failed", str(job.error))
+
+        else:
+            self._save_last_report(job.report_path)
+
+            risks = job.counts.get("RISK", 0)
+            todos = job.counts.get("TODO", 0)
+
+            self.last_risks = risks
+            self.last_todos = todos
+            self._update_title_badge()
+            self._refresh_mode_checks()
+
+            write_status({
+                "last_risks": risks,
+                "last_todos": todos,
+                "mode": job.mode,
+            })
+
+            rumps.notification(
+                "Zinkx",
+                f"Scan Complete ({label})",
+                f"Risks: {risks} | TODO: {todos}",
+            )
+
+            open_path(job.report_path)
 
-        open_path(str(report_path))
+        if self._queued_scan:
+            project, mode = self._queued_scan
+            self._queued_scan = None
+            self._start_scan(project, mode)
 
     # --------------------------------------------------
     # Other actions
@@ -1,7 +1,13 @@
+import copy
 import json
 import os
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Dict, Any
 
+from fileio import atomic_write
+
 # --------------------------------------------------
 # Config path
 # --------------------------------------------------
@@ -20,7 +26,30 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 
     # Progress / IPC
     "show_scan_progress": True,       # scan sırasında progress bar göster
-    "scan_progress_steps": [20, 50, 80, 100],  # IPC % adımları
+    "scan_progress_interval": 0.25,   # progress IPC en fazla bu kadar saniyede bir
+
+    # Parallel scan
+    "scan_workers": 0,                # 0 = CPU sayısı, 1 = seri tarama
+    "scan_executor": "process",       # process | thread
+    "scan_parallel_min_files": 200,   # bunun altında pool açılmaz
+
+    # Large files
+    "scan_in_memory_limit": 400_000,  # bu boyuta kadar tek seferde oku (byte)
+    "scan_chunk_bytes": 1_048_576,    # üstü satır hizalı parçalarla taranır
+    "scan_max_line_chars": 4096,      # minified dosyalarda kural penceresi (0 = sınırsız)
+
+    # Incremental scan cache (~/.zinkx_dev_assistant/cache)
+    "scan_cache": True,               # değişmeyen dosyaların bulgularını yeniden kullan
+    "scan_cache_hash": False,         # mtime değişince içerik hash'iyle doğrula
+
+    # Scan daemon
+    "scan_daemon": True,              # launcher sıcak cache'li tarama daemon'ı başlatsın
+
+    # Pre-commit
+    "precommit_fail_fast": True,      # ilk RISK'te taramayı durdur
+    "precommit_scan_scope": "diff",   # diff = sadece staged eklenen satırlar | files = staged dosyaların tamamı
+    "precommit_report": "risk",       # HTML rapor: risk | always | never
+    "precommit_open_report": True,    # risk raporunu tarayıcıda aç
 
     # =========================
     # Ignore rules
@@ -44,6 +73,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         },
         "enable_search": True,        # report search aktif
         "inline_preview": False,      # (ileride) HTML inline preview
+        "html_virtual_threshold": 2000,  # bu kadar bulgudan sonra sanal liste HTML (0 = hep kart)
+        "export_formats": ["jsonl"],  # HTML'in yanına: jsonl | sarif
     },
 
     # =========================
@@ -53,6 +84,15 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "remember_last_page": True,       # app açıldığında son sayfa
 }
 
+# --------------------------------------------------
+# In-memory state (mtime bazlı reload)
+# --------------------------------------------------
+_lock = threading.RLock()
+_cached: Dict[str, Any] | None = None
+_cached_stamp: tuple[int, int] | None = None
+_snapshot: "ConfigSnapshot | None" = None
+
+
 # --------------------------------------------------
 # Helpers
 # --------------------------------------------------
@@ -61,7 +101,7 @@ def _merge_with_defaults(cfg: Dict[str, Any]) -> Dict[str, Any]:
     Eksik alanları DEFAULT_CONFIG ile tamamlar.
     Nested dict'leri de güvenli şekilde merge eder.
     """
-    merged = DEFAULT_CONFIG.copy()
+    merged = copy.deepcopy(DEFAULT_CONFIG)
 
     for key, value in (cfg or {}).items():
         if isinstance(value, dict) and isinstance(merged.get(key), dict):
@@ -71,36 +111,124 @@ def _merge_with_defaults(cfg: Dict[str, Any]) -> Dict[str, Any]:
 
     return merged
 
+
+def _stamp() -> tuple[int, int] | None:
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _write_atomic(cfg: Dict[str, Any]):
+    """
+    Temp dosyaya yazıp os.replace: okuyan taraf yarım JSON görmez.
+    """
+    with atomic_write(CONFIG_PATH, encoding="utf-8") as f:
+        json.dump(cfg, f, indent=2, ensure_ascii=False)
+
+
+def _remember(cfg: Dict[str, Any]):
+    global _cached, _cached_stamp, _snapshot
+    _cached = cfg
+    _cached_stamp = _stamp()
+    _snapshot = None
+
+
+def _current() -> Dict[str, Any]:
+    """
+    Merge edilmiş config (paylaşılan kopya, değiştirilmemeli).
+    Disk sadece dosyanın mtime/size'ı değiştiyse tekrar okunur;
+    dosya eksik alanlıysa ya da bozuksa bir kez yazılır (auto-migrate).
+    """
+    with _lock:
+        stamp = _stamp()
+        if _cached is not None and stamp == _cached_stamp:
+            return _cached
+
+        raw = None
+        if stamp is not None:
+            try:
+                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+            except Exception:
+                raw = None
+
+        cfg = _merge_with_defaults(raw if isinstance(raw, dict) else {})
+        if cfg != raw:
+            try:
+                _write_atomic(cfg)
+            except OSError:
+                pass
+
+        _remember(cfg)
+        return cfg
+
+
+class ConfigSnapshot(Mapping):
+    """
+    Config'in değiştirilemez anlık görüntüsü.
+    dict gibi okunur (cfg.get(...)); nested dict'ler read-only,
+    listeler tuple'dır. Tarama boyunca diske hiç dokunmadan kullanılır.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, cfg: Dict[str, Any]):
+        self._data = _freeze(cfg)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot({dict(self._data)!r})"
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 # --------------------------------------------------
 # Load config
 # --------------------------------------------------
 def load_config() -> Dict[str, Any]:
-    if not os.path.exists(CONFIG_PATH):
-        cfg = DEFAULT_CONFIG.copy()
-        save_config(cfg)
-        return cfg
+    """
+    Değiştirilebilir kopya döner (settings ekranları düzenleyip
+    save_config'e verir). Sadece okuyacaksan config_snapshot() daha ucuz.
+    """
+    return copy.deepcopy(_current())
 
-    try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            raw = json.load(f)
 
-        cfg = _merge_with_defaults(raw)
-        save_config(cfg)  # eksik alanları kalıcı yaz (auto-migrate)
-        return cfg
-
-    except Exception:
-        cfg = DEFAULT_CONFIG.copy()
-        save_config(cfg)
-        return cfg
+def config_snapshot() -> ConfigSnapshot:
+    """
+    Dosya değişmedikçe aynı snapshot nesnesi döner.
+    """
+    global _snapshot
+    with _lock:
+        cfg = _current()
+        if _snapshot is None:
+            _snapshot = ConfigSnapshot(cfg)
+        return _snapshot
 
 # --------------------------------------------------
 # Save config
 # --------------------------------------------------
 def save_config(cfg: Dict[str, Any]):
-    os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-
     # Partial update’ler için güvenli merge
-    final_cfg = _merge_with_defaults(cfg)
+    final_cfg = _merge_with_defaults(dict(cfg))
 
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(final_cfg, f, indent=2, ensure_ascii=False)
+    with _lock:
+        if final_cfg == _current():
+            return              # değişiklik yok → disk'e yazma
+        _write_atomic(final_cfg)
+        _remember(final_cfg)
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+from urllib.parse import quote
+
+from config import ConfigSnapshot, config_snapshot
+from fileio import WRITE_BUFFER
+from scanner import FINDING_PRIORITY, Finding, FindingStore, count_by_kind
+
+# --------------------------------------------------
+# Formats
+# --------------------------------------------------
+EXPORT_JSONL = "jsonl"
+EXPORT_SARIF = "sarif"
+
+# JSONL kayıt formatı değişirse artır
+JSONL_FORMAT = 1
+
+TOOL_NAME = "Zinkx Dev Assistant"
+TOOL_URI = "https://github.com/zinkxx/zinkx-dev-assistant"
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"RISK": "error", "TODO": "warning", "INFO": "note"}
+
+
+# Tek encoder: json.dumps özel argümanlarla her çağrıda yenisini kurar
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+# --------------------------------------------------
+# JSONL
+# --------------------------------------------------
+# Satır 1: {"type": "scan", ...} başlık, sonra her bulgu bir satır
+# ({"kind", "title", "detail", "path", "line", "rule"}), son satır
+# {"type": "summary", "counts": ...}. "type"'sız kayıtlar bulgudur.
+def _write_rows(out, findings: Iterable[Finding]) -> Iterator[Finding]:
+    for f in findings:
+        out.write(_dumps({
+            "kind": f.kind,
+            "title": f.title,
+            "detail": f.detail,
+            "path": f.path,
+            "line": f.line,
+            "rule": f.rule,
+        }) + "\n")
+        yield f
+
+
+def write_jsonl(
+    findings: Iterable[Finding],
+    path: str | Path,
+    project_root: str,
+    mode: str | None = None,
+) -> Path:
+    """
+    Bulguları akış halinde yazar (generator da olabilir); bellekte
+    sadece kind sayaçları tutulur.
+    """
+    path = Path(path)
+
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER) as out:
+        out.write(_dumps({
+            "type": "scan",
+            "format": JSONL_FORMAT,
+            "project": project_root,
+            "mode": mode,
+            "date": datetime.now().isoformat(timespec="seconds"),
+        }) + "\n")
+
+        # Sayım yazılan akış üzerinden: generator iki kez okunamaz
+        counts = count_by_kind(_write_rows(out, findings))
+
+        out.write(_dumps({
+            "type": "summary",
+            "counts": counts,
+            "total": sum(counts.values()),
+        }) + "\n")
+
+    return path
+
+
+def load_jsonl(path: str | Path) -> tuple[Dict[str, Any], FindingStore]:
+    """
+    write_jsonl çıktısını geri okur: (meta, sıralı FindingStore).
+    meta başlık + özet kayıtlarının birleşimidir. Yarım yazılmış son
+    satır (ör. kesilen tarama) atlanır.
+    """
+    meta: Dict[str, Any] = {}
+    findings = FindingStore()
+    loads = json.loads
+    add = findings.add
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = loads(line)
+            except ValueError:
+                continue
+            if "type" in rec:
+                meta.update(rec)
+                continue
+            add(
+                rec["kind"], rec["title"], rec["detail"], rec["path"],
+                rec.get("line"), rec.get("rule", ""),
+            )
+
+    meta.pop("type", None)
+    findings.sort()
+    return meta, findings
+
+
+# --------------------------------------------------
+# SARIF 2.1.0
+# --------------------------------------------------
+def _artifact_location(path: str, root: str) -> Dict[str, Any]:
+    try:
+        rel = os.path.relpath(path, root)
+    except ValueError:
+        rel = None
+    if rel is None or rel.startswith(".."):
+        return {"uri": Path(path).as_uri()}
+    return {"uri": quote(Path(rel).as_posix()), "uriBaseId": "SRCROOT"}
+
+
+def _rule_id(f: Finding) -> str:
+    # rule'suz bulgu (ör. eski JSONL'den): başlıktan türetilmiş, "/" içermeyen id
+    return f.rule or re.sub(r"[^a-z0-9]+", "_", f.title.lower()).strip("_")
+
+
+def write_sarif(
+    findings: Iterable[Finding],
+    path: str | Path,
+    project_root: str,
+) -> Path:
+    """
+    Tek run'lı SARIF log'u. ruleId kuralın sabit id'si (rules.Rule.id),
+    başlık kuralın name / shortDescription'ı. Sonuçlar akış halinde
+    yazılır; kural tablosu sonuçlardan sonra, run objesinin sonunda gelir.
+    """
+    path = Path(path)
+    root = str(Path(project_root).expanduser().resolve())
+    rule_ids: Dict[str, int] = {}               # rule id → index
+    rule_titles: Dict[str, str] = {}
+    rule_levels: Dict[str, str] = {}
+    locations: Dict[str, Dict[str, Any]] = {}     # path → artifactLocation
+
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER) as out:
+        out.write(
+            f'{{"$schema":{_dumps(SARIF_SCHEMA)},"version":"2.1.0","runs":[{{'
+            f'"originalUriBaseIds":{{"SRCROOT":{{"uri":{_dumps(Path(root).as_uri() + "/")}}}}},'
+            f'"results":['
+        )
+
+        sep = ""
+        for f in findings:
+            rule_id = _rule_id(f)
+            idx = rule_ids.get(rule_id)
+            if idx is None:
+                idx = rule_ids[rule_id] = len(rule_ids)
+                rule_titles[rule_id] = f.title
+            level = SARIF_LEVELS.get(f.kind, "note")
+            # Kuralın varsayılan seviyesi: gördüğü en yüksek öncelikli kind
+            prev = rule_levels.get(rule_id)
+            if prev is None or FINDING_PRIORITY.get(f.kind, 9) < FINDING_PRIORITY.get(prev, 9):
+                rule_levels[rule_id] = f.kind
+
+            artifact = locations.get(f.path)
+            if artifact is None:
+                artifact = locations[f.path] = _artifact_location(f.path, root)
+
+            location: Dict[str, Any] = {"artifactLocation": artifact}
+            if f.line:
+                location["region"] = {"startLine": f.line}
+
+            out.write(sep + _dumps({
+                "ruleId": rule_id,
+                "ruleIndex": idx,
+                "level": level,
+                "message": {"text": f.detail},
+                "locations": [{"physicalLocation": location}],
+            }))
+            sep = ","
+
+        rules = [
+            {
+                "id": rule_id,
+                "name": rule_titles[rule_id],
+                "shortDescription": {"text": rule_titles[rule_id]},
+                "defaultConfiguration": {
+                    "level": SARIF_LEVELS.get(rule_levels[rule_id], "note"),
+                },
+            }
+            for rule_id in rule_ids
+        ]
+        out.write(
+            '],"tool":{"driver":'
+            + _dumps({"name": TOOL_NAME, "informationUri": TOOL_URI, "rules": rules})
+            + "}}]}\n"
+        )
+
+    return path
+
+
+# --------------------------------------------------
+# Reports dir
+# --------------------------------------------------
+def write_exports(
+    findings: Iterable[Finding],
+    report_file: str | Path,
+    project_root: str,
+    mode: str | None = None,
+    config: ConfigSnapshot | None = None,
+) -> list[Path]:
+    """
+    reports.export_formats'taki her format için HTML raporun yanına aynı
+    isimle yazar: report-X.html → report-X.jsonl / report-X.sarif.
+    findings birden fazla kez okunur: Sequence (FindingStore) olmalı.
+    """
+    cfg = config if config is not None else config_snapshot()
+    formats = cfg.get("reports", {}).get("export_formats", [EXPORT_JSONL])
+
+    report_file = Path(report_file)
+    written: list[Path] = []
+    for fmt in formats:
+        path = report_file.with_suffix(f".{fmt}")
+        if fmt == EXPORT_JSONL:
+            written.append(write_jsonl(findings, path, project_root, mode))
+        elif fmt == EXPORT_SARIF:
+            written.append(write_sarif(findings, path, project_root))
+    return written
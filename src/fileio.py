@@ -0,0 +1,76 @@
+import os
+from contextlib import contextmanager
+from typing import IO, Iterator, NamedTuple
+
+# Büyük raporlar / export'lar için open(..., buffering=WRITE_BUFFER)
+WRITE_BUFFER = 1 << 16
+
+
+# --------------------------------------------------
+# Atomic write
+# --------------------------------------------------
+@contextmanager
+def atomic_write(path: str, mode: str = "w", **kwargs) -> Iterator[IO]:
+    """
+    Aynı dizinde temp dosyaya yazar, blok hatasız biterse os.replace ile
+    path'in yerine koyar: okuyan taraf yarım dosya görmez. Hata olursa
+    temp dosya silinir ve hata yukarı iletilir.
+
+        with atomic_write(CONFIG_PATH, encoding="utf-8") as f:
+            json.dump(cfg, f)
+    """
+    import tempfile     # kısa ömürlü process'ler (hook) ödemesin diye lazy
+
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# --------------------------------------------------
+# Append-only log reader
+# --------------------------------------------------
+class Appended(NamedTuple):
+    lines: list[bytes]          # yeni tam satırlar (satır sonu hariç)
+    cursor: tuple[int, int]     # (inode, offset): bir sonraki çağrıya verilir
+    reset: bool                 # dosya baştan okundu (yeni, değişti ya da küçüldü)
+
+
+def read_appended(path: str, cursor: tuple[int, int] = (0, 0)) -> Appended | None:
+    """
+    Append-only dosyada cursor'dan sonra eklenen tam satırlar. Sadece
+    satır sonuyla biten satırlar döner, yarım son satır bir sonraki
+    çağrıda okunur. Dosya değişmiş (inode) ya da küçülmüşse baştan okunur.
+    Dosya yoksa / okunamazsa None.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    ino, offset = cursor
+    reset = ino != st.st_ino or offset > st.st_size
+    if reset:
+        offset = 0
+    if offset == st.st_size:
+        return Appended([], (st.st_ino, offset), reset)
+
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except OSError:
+        return None
+
+    complete = data[:data.rfind(b"\n") + 1]    # yarım son satırı atla
+    return Appended(complete.split(b"\n")[:-1], (st.st_ino, offset + len(complete)), reset)
@@ -1,32 +1,578 @@
+import os
+import re
+import struct
 import subprocess
+import threading
 from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
 
+# Submodule (gitlink) modu; hem index'te hem porcelain v2'de
+GITLINK_MODE = 0o160000
 
-def get_changed_files(repo_path: str) -> list[str]:
-    repo = Path(repo_path)
-    if not (repo / ".git").exists():
-        return []
 
+# --------------------------------------------------
+# Models
+# --------------------------------------------------
+class ChangedFile(NamedTuple):
+    path: str               # repo köküne göre (rename'de yeni path)
+    xy: str                 # porcelain XY ("M.", ".M", "A.", "R.", "??" ...)
+    index_sha: str | None   # index'teki blob (untracked'te None)
+    orig_path: str | None = None    # rename/copy kaynağı
+
+
+class IndexEntry(NamedTuple):
+    path: str
+    sha: str
+    mode: int
+    size: int
+    mtime_ns: int
+
+
+# --------------------------------------------------
+# git process helpers
+# --------------------------------------------------
+# Hook'a git'in verdiği repo/index değişkenleri (commit -a / commit <path>
+# geçici bir index kullanır). Başka bir process'te aynı index'i okumak için.
+HOOK_GIT_ENV = ("GIT_DIR", "GIT_INDEX_FILE")
+
+
+def hook_git_env() -> dict[str, str]:
+    """
+    Bu process'teki HOOK_GIT_ENV değişkenleri, path'ler mutlak.
+    """
+    return {
+        name: os.path.abspath(os.environ[name])
+        for name in HOOK_GIT_ENV
+        if os.environ.get(name)
+    }
+
+
+def _git(repo: str, *args: str, env: dict[str, str] | None = None) -> bytes | None:
+    """
+    Shell'siz doğrudan git (login shell / profile yüklemez).
+    env: bu process'in ortamına eklenecek değişkenler (ör. hook_git_env()).
+    """
     try:
-        cmd = "git status --porcelain"
         r = subprocess.run(
-            ["bash", "-lc", f"cd '{repo_path}' && {cmd}"],
+            ["git", "-C", repo, *args],
             capture_output=True,
-            text=True,
+            env={**os.environ, **env} if env else None,
         )
-        if r.returncode != 0:
-            return []
+    except OSError:
+        return None
+    if r.returncode != 0:
+        return None
+    return r.stdout
+
+
+def _decode_path(raw: bytes) -> str:
+    return os.fsdecode(raw)
+
+
+# --------------------------------------------------
+# Status (porcelain v2, -z)
+# --------------------------------------------------
+def iter_status(repo_path: str, untracked: bool = True) -> Iterator[ChangedFile]:
+    """
+    `git status --porcelain=v2 -z` kayıtları. -z sayesinde boşluklu /
+    unicode / tırnak gerektiren path'ler olduğu gibi gelir; rename'ler
+    yeni path ile verilir, submodule'lar atlanır.
+    """
+    out = _git(
+        repo_path,
+        "status",
+        "--porcelain=v2",
+        "-z",
+        "--untracked-files=normal" if untracked else "--untracked-files=no",
+        "--ignore-submodules=all",
+    )
+    if not out:
+        return
+
+    fields = out.split(b"\0")
+    i = 0
+    while i < len(fields):
+        rec = fields[i]
+        i += 1
+        if not rec:
+            continue
+
+        kind = rec[:1]
+
+        if kind == b"1":
+            # 1 XY sub mH mI mW hH hI path
+            parts = rec.split(b" ", 8)
+            if parts[2][:1] == b"S" or int(parts[4], 8) == GITLINK_MODE:
+                continue
+            yield ChangedFile(
+                _decode_path(parts[8]),
+                parts[1].decode(),
+                _sha_or_none(parts[7]),
+            )
+
+        elif kind == b"2":
+            # 2 XY sub mH mI mW hH hI Xscore path \0 origPath
+            parts = rec.split(b" ", 9)
+            orig = fields[i] if i < len(fields) else b""
+            i += 1
+            if parts[2][:1] == b"S" or int(parts[4], 8) == GITLINK_MODE:
+                continue
+            yield ChangedFile(
+                _decode_path(parts[9]),
+                parts[1].decode(),
+                _sha_or_none(parts[7]),
+                _decode_path(orig),
+            )
+
+        elif kind == b"u":
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path (merge conflict)
+            parts = rec.split(b" ", 10)
+            if parts[2][:1] == b"S":
+                continue
+            yield ChangedFile(_decode_path(parts[10]), parts[1].decode(), None)
+
+        elif kind == b"?":
+            yield ChangedFile(_decode_path(rec[2:]), "??", None)
+
+        # "!" (ignored) ve "#" (header) kayıtları atlanır
+
+
+def _sha_or_none(raw: bytes) -> str | None:
+    sha = raw.decode()
+    return None if not sha.strip("0") else sha
 
-        files: list[str] = []
-        for line in r.stdout.splitlines():
-            if not line:
+
+# --------------------------------------------------
+# Staged diff (git diff --cached -U0)
+# --------------------------------------------------
+_HUNK_RE = re.compile(rb"@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+_C_ESCAPES = {
+    ord("a"): 7, ord("b"): 8, ord("t"): 9, ord("n"): 10,
+    ord("v"): 11, ord("f"): 12, ord("r"): 13,
+    ord('"'): ord('"'), ord("\\"): ord("\\"),
+}
+
+
+def _unquote_path(raw: bytes) -> bytes:
+    """
+    git'in C-style tırnaklı path'i ("a\\tb", "\\303\\251") → ham byte'lar.
+    """
+    if not (raw.startswith(b'"') and raw.endswith(b'"')):
+        return raw
+
+    body, out, i = raw[1:-1], bytearray(), 0
+    while i < len(body):
+        c = body[i]
+        if c != 0x5C:                       # ters bölü
+            out.append(c)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if 0x30 <= nxt <= 0x37:             # \ooo (octal byte)
+            out.append(int(body[i + 1:i + 4], 8))
+            i += 4
+        else:
+            out.append(_C_ESCAPES.get(nxt, nxt))
+            i += 2
+    return bytes(out)
+
+
+def iter_staged_added_lines(repo_path: str) -> Iterator[tuple[str, list[tuple[int, str]]]]:
+    """
+    Staged diff'teki eklenen/değişen satırlar: (path, [(yeni satır no, metin)]).
+    Hunk'ı olan her dosya gelir; sadece satır silinen ya da tamamen silinen
+    dosyalar boş listeyle gelir (path yine de "dokunuldu" sayılabilsin diye).
+    Binary'ler, submodule'lar ve saf rename'ler hunk üretmez, hiç gelmez.
+    """
+    out = _git(
+        repo_path,
+        "-c", "core.quotePath=false",
+        "diff",
+        "--cached",
+        "-U0",
+        "--no-color",
+        "--no-ext-diff",
+        "--no-textconv",
+        # diff.noprefix / diff.mnemonicPrefix header path'lerini değiştirmesin
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+        "--ignore-submodules=all",
+    )
+    if not out:
+        return
+
+    path: str | None = None
+    old_path: str | None = None
+    added: list[tuple[int, str]] = []
+    old_left = new_left = 0
+    new_line = 0
+
+    for raw in out.split(b"\n"):
+        # Hunk içindeyken "+++"/"---" ile başlayan satırlar içeriktir
+        if old_left or new_left:
+            tag = raw[:1]
+            if tag == b"+":
+                text = raw[1:].decode("utf-8", errors="ignore")
+                added.append((new_line, text[:-1] if text.endswith("\r") else text))
+                new_line += 1
+                new_left -= 1
+            elif tag == b"-":
+                old_left -= 1
+            elif tag == b" ":
+                new_line += 1
+                old_left -= 1
+                new_left -= 1
+            # "\ No newline at end of file" sayaçları etkilemez
+            continue
+
+        if raw.startswith(b"diff --git "):
+            if path:
+                yield path, added
+            path, old_path, added = None, None, []
+
+        elif raw.startswith(b"--- "):
+            old_path = _diff_header_path(raw, b"a/")
+
+        elif raw.startswith(b"+++ "):
+            # Silinen dosyada yeni path /dev/null → eski path
+            path = _diff_header_path(raw, b"b/") or old_path
+
+        elif raw.startswith(b"@@"):
+            m = _HUNK_RE.match(raw)
+            if not m:
                 continue
-            # format: XY path
-            path = line[3:].strip()
-            full = repo / path
-            if full.exists() and full.is_file():
-                files.append(str(full))
-
-        return files
-    except Exception:
-        return []
+            old_left = int(m.group(1)) if m.group(1) is not None else 1
+            new_line = int(m.group(2))
+            new_left = int(m.group(3)) if m.group(3) is not None else 1
+
+    if path:
+        yield path, added
+
+
+def _diff_header_path(raw: bytes, prefix: bytes) -> str | None:
+    # Boşluklu path'lerin sonuna git bir TAB ekler
+    target = _unquote_path(raw[4:].rstrip(b"\t"))
+    if target == b"/dev/null":
+        return None
+    return _decode_path(target[len(prefix):] if target.startswith(prefix) else target)
+
+
+def staged_files_containing(
+    repo_path: str,
+    needle: str,
+    paths: list[str],
+    git_env: dict[str, str] | None = None,
+) -> set[str]:
+    """
+    Staged içeriğinde needle geçen path'ler (git grep --cached).
+    Diff modunda dosya seviyesindeki ignore marker'ı, dosyanın
+    değişmeyen kısmında olsa bile yakalamak için. Hook dışında (daemon)
+    çağrılıyorsa git_env hook'un hook_git_env()'i olmalı.
+    """
+    found: set[str] = set()
+    for batch in _path_batches(paths):
+        out = _git(
+            repo_path,
+            "--literal-pathspecs",          # "*", "?", "[" içeren adlar glob değil
+            "-c", "core.quotePath=false",
+            "grep", "--cached", "-l", "-z", "-F", "-e", needle, "--", *batch,
+            env=git_env,
+        )
+        if out:             # boşsa eşleşme yok (git grep 1 döner)
+            found.update(_decode_path(p) for p in out.split(b"\0") if p)
+    return found
+
+
+# Komut satırı sınırı (Windows ~32K karakter) aşılmasın
+PATHSPEC_BATCH_CHARS = 16_000
+
+
+def _path_batches(paths: list[str]) -> Iterator[list[str]]:
+    batch: list[str] = []
+    size = 0
+    for p in paths:
+        if batch and size + len(p) + 1 > PATHSPEC_BATCH_CHARS:
+            yield batch
+            batch, size = [], 0
+        batch.append(p)
+        size += len(p) + 1
+    if batch:
+        yield batch
+
+
+# --------------------------------------------------
+# .git/index reader (git'siz hızlı yol)
+# --------------------------------------------------
+def _git_dir(repo: Path) -> Path | None:
+    dotgit = repo / ".git"
+    if dotgit.is_dir():
+        return dotgit
+    # worktree / submodule: ".git" dosyası "gitdir: <path>" içerir
+    try:
+        line = dotgit.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not line.startswith("gitdir:"):
+        return None
+    gd = Path(line[len("gitdir:"):].strip())
+    return gd if gd.is_absolute() else (repo / gd).resolve()
+
+
+_OBJECT_FORMAT_RE = re.compile(rb"^\s*objectformat\s*=\s*(\w+)", re.I | re.M)
+
+
+def _is_sha1_repo(git_dir: Path) -> bool:
+    """
+    extensions.objectFormat sha1 (varsayılan) mı. Worktree'lerde config
+    ortak dizindedir (commondir). Config okunamazsa False: çağıran git'e düşer.
+    """
+    common = git_dir
+    try:
+        rel = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        common = (git_dir / rel).resolve()
+    except OSError:
+        pass
+    try:
+        config = (common / "config").read_bytes()
+    except OSError:
+        return False
+    m = _OBJECT_FORMAT_RE.search(config)
+    return m is None or m.group(1).lower() == b"sha1"
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """
+    Index v4 path sıkıştırmasındaki offset varint'i (git'in encode_varint'i).
+    """
+    c = data[pos]
+    pos += 1
+    value = c & 0x7F
+    while c & 0x80:
+        value += 1
+        c = data[pos]
+        pos += 1
+        value = (value << 7) + (c & 0x7F)
+    return value, pos
+
+
+_ENTRY_HEAD = struct.Struct(">10I20sH")     # stat alanları + sha1 + flags
+
+
+def read_index(repo_path: str) -> dict[str, IndexEntry] | None:
+    """
+    .git/index'i (ya da GIT_INDEX_FILE'ı, v2–v4) doğrudan okur; sadece
+    stage 0 dosya kayıtları.
+    git process açmadan staged blob sha'larını verir.
+    Desteklenmeyen durumda (split index, sha256 repo, bozuk dosya) None
+    döner; çağıran git'e düşmeli.
+    """
+    env_git_dir = os.environ.get("GIT_DIR")
+    git_dir = Path(env_git_dir) if env_git_dir else _git_dir(Path(repo_path))
+    if git_dir is None or not _is_sha1_repo(git_dir):
+        return None     # sha256 repo'da kayıtlar 32 byte hash'li: bu parser okuyamaz
+
+    # Hook'ta (commit -a / commit <path>) git geçici index'i GIT_INDEX_FILE ile verir
+    index_file = os.environ.get("GIT_INDEX_FILE")
+    # göreliyse git gibi cwd'ye göre
+    index_path = Path(index_file) if index_file else git_dir / "index"
+
+    try:
+        data = index_path.read_bytes()
+    except OSError:
+        return None
+
+    if len(data) < 12 or data[:4] != b"DIRC":
+        return None
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3, 4):
+        return None
+
+    entries: dict[str, IndexEntry] = {}
+    pos = 12
+    prev_name = b""
+    end = len(data) - 20        # sondaki checksum
+
+    try:
+        for _ in range(count):
+            start = pos
+            (
+                _ctime_s, _ctime_ns, mtime_s, mtime_ns,
+                _dev, _ino, mode, _uid, _gid, size, sha, flags,
+            ) = _ENTRY_HEAD.unpack_from(data, pos)
+            pos += _ENTRY_HEAD.size
+
+            if version >= 3 and flags & 0x4000:
+                pos += 2        # extended flags
+
+            if version == 4:
+                strip, pos = _read_varint(data, pos)
+                nul = data.index(b"\0", pos)
+                name = prev_name[:len(prev_name) - strip] + data[pos:nul]
+                pos = nul + 1
+            else:
+                nul = data.index(b"\0", pos)
+                name = data[pos:nul]
+                # entry 8 byte'a hizalı, en az bir NUL
+                pos = start + ((nul - start + 8) & ~7)
+            prev_name = name
+
+            stage = (flags >> 12) & 0x3
+            if stage != 0 or (mode & 0o170000) not in (0o100000, 0o120000):
+                continue        # conflict, gitlink, sparse dizin kaydı
+
+            path = _decode_path(name)
+            entries[path] = IndexEntry(
+                path,
+                sha.hex(),
+                mode,
+                size,
+                mtime_s * 1_000_000_000 + mtime_ns,
+            )
+
+        # Extension'lar: split index ("link") varsa kayıtlar eksiktir
+        while pos + 8 <= end:
+            sig = data[pos:pos + 4]
+            (ext_len,) = struct.unpack_from(">I", data, pos + 4)
+            if sig == b"link":
+                return None
+            pos += 8 + ext_len
+
+        # Kayıtlar + extension'lar checksum'a tam oturmalı; oturmuyorsa
+        # format yanlış okunmuştur (ör. tanınmayan hash boyu)
+        if pos != end:
+            return None
+
+    except (struct.error, ValueError, IndexError):
+        return None
+
+    return entries
+
+
+def iter_staged_blobs(repo_path: str) -> Iterator[tuple[str, str]]:
+    """
+    HEAD'e göre eklenen/değişen staged dosyalar: (path, index blob sha'sı).
+    Hangi path'lerin staged olduğu `git diff --cached --name-only`'den
+    gelir (sadece index ↔ HEAD, working tree stat'lanmaz); sha'lar
+    .git/index'ten okunur. Index okunamazsa porcelain status'a düşülür.
+    """
+    out = _git(
+        repo_path,
+        "diff",
+        "--cached",
+        "--name-only",
+        "-z",
+        "--no-renames",
+        "--no-relative",
+        "--diff-filter=d",
+        "--ignore-submodules=all",
+    )
+    if not out:
+        return
+    paths = [_decode_path(p) for p in out.split(b"\0") if p]
+
+    index = read_index(repo_path)
+    if index is None:
+        shas = {
+            cf.path: cf.index_sha
+            for cf in iter_status(repo_path, untracked=False)
+            if cf.index_sha
+        }
+    else:
+        shas = {path: entry.sha for path, entry in index.items()}
+
+    for path in paths:
+        sha = shas.get(path)
+        if sha:
+            yield path, sha
+
+
+# --------------------------------------------------
+# git cat-file --batch (uzun ömürlü)
+# --------------------------------------------------
+class GitCatFile:
+    """
+    Tek `git cat-file --batch` process'i üzerinden blob okuma.
+    Dosya başına process açmak yerine istekler aynı pipe'a yazılır.
+
+        with GitCatFile(repo) as cat:
+            for spec, data in cat.read_many(shas):
+                ...
+    """
+
+    def __init__(self, repo_path: str):
+        self.proc = subprocess.Popen(
+            ["git", "-C", repo_path, "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._pending = 0       # gönderilip cevabı okunmamış istekler
+
+    def __enter__(self) -> "GitCatFile":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _read_reply(self) -> bytes | None:
+        out = self.proc.stdout
+        header = out.readline()
+        self._pending -= 1
+        if not header:
+            raise OSError("git cat-file exited")
+
+        # "<sha> <type> <size>\n" ya da "<spec> missing\n"
+        parts = header.split()
+        if len(parts) != 3 or parts[1] == b"missing":
+            return None
+
+        size = int(parts[2])
+        data = out.read(size)
+        out.read(1)             # içerikten sonraki "\n"
+        return data
+
+    def read_many(self, specs: Iterable[str]) -> Iterator[tuple[str, bytes | None]]:
+        """
+        İstekleri ayrı thread'de yazar, cevapları sırayla okur; pipe
+        buffer'ları dolup iki taraf birbirini beklemez.
+        """
+        specs = list(specs)
+        self._pending += len(specs)
+
+        def feed():
+            try:
+                for spec in specs:
+                    self.proc.stdin.write(spec.encode("utf-8") + b"\n")
+                self.proc.stdin.flush()
+            except (OSError, ValueError):
+                pass
+
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        finished = False
+        try:
+            for spec in specs:
+                yield spec, self._read_reply()
+            finished = True
+        finally:
+            if not finished:
+                # Okunmamış cevaplar pipe'ta kaldı: process tekrar kullanılamaz
+                self.proc.kill()
+            writer.join()
+
+    def close(self):
+        if self.proc.poll() is None and self._pending > 0:
+            # Cevaplar okunmadan bırakıldı (ör. read_many yarıda): git
+            # dolu stdout pipe'ına yazarken bekler, stdin'i kapatmak yetmez
+            self.proc.kill()
+            self.proc.wait()
+        elif self.proc.poll() is None:
+            try:
+                self.proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
@@ -1,15 +1,138 @@
 import json
 import os
-from typing import Any, Dict
+import threading
+from typing import Any, Callable, Dict, NamedTuple
+
+from fileio import atomic_write, read_appended
 
 STATE_DIR = os.path.expanduser("~/.zinkx_dev_assistant")
-os.makedirs(STATE_DIR, exist_ok=True)
 
 CMD_FILE = os.path.join(STATE_DIR, "command.json")
-STATUS_FILE = os.path.join(STATE_DIR, "status.json")
+STATUS_FILE = os.path.join(STATE_DIR, "status.json")     # son özet (atomik)
+STATUS_LOG = os.path.join(STATE_DIR, "status.log")       # seq numaralı kayıtlar (JSONL)
+STATUS_LOCK = os.path.join(STATE_DIR, "status.lock")
+
+# status.log bu boyutu geçince son STATUS_LOG_KEEP kayda sıkıştırılır
+STATUS_LOG_MAX_BYTES = 256 * 1024
+STATUS_LOG_KEEP = 200
+
+# --------------------------------------------------
+# Message types
+# --------------------------------------------------
+MSG_COMMAND = "command"     # Qt → menu bar: scan, menu bar → Qt: show_window
+MSG_STATUS = "status"       # scanner/menu bar → Qt: progress + son özet
+
+
+class Message(NamedTuple):
+    kind: str                   # MSG_COMMAND | MSG_STATUS
+    payload: Dict[str, Any]
+
+
+# --------------------------------------------------
+# Message bus (launcher'ın açtığı multiprocessing.Pipe üzerinde)
+# --------------------------------------------------
+class _Bus:
+    """
+    Process başına tek bağlantı. Okuma ayrı bir daemon thread'de bloklanır
+    (polling yok); gelen mesajlar kind'a göre subscriber'lara dağıtılır.
+    Callback'ler bu thread'de çağrılır: UI tarafı kendi main thread'ine
+    aktarmalı (Qt Signal, AppHelper.callAfter).
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._send_lock = threading.Lock()
+        self._sub_lock = threading.Lock()
+        self._subs: Dict[str, list[Callable[[Dict[str, Any]], None]]] = {}
+        self._pending: list[Message] = []   # subscriber gelmeden önce gelenler
+
+        self._thread = threading.Thread(
+            target=self._run, name="zinkx-ipc", daemon=True
+        )
+        self._thread.start()
+
+    def send(self, kind: str, payload: Dict[str, Any]) -> bool:
+        try:
+            with self._send_lock:
+                self.conn.send(Message(kind, payload))
+            return True
+        except (OSError, EOFError, ValueError):
+            return False        # karşı process kapanmış
+
+    def subscribe(self, kind: str, callback: Callable[[Dict[str, Any]], None]):
+        with self._sub_lock:
+            self._subs.setdefault(kind, []).append(callback)
+            ready = [m for m in self._pending if m.kind == kind]
+            self._pending = [m for m in self._pending if m.kind != kind]
+
+        for msg in ready:
+            self._deliver(callback, msg)
+
+    def _run(self):
+        while True:
+            try:
+                msg = self.conn.recv()
+            except (EOFError, OSError):
+                return
+            if not isinstance(msg, Message):
+                continue
+
+            with self._sub_lock:
+                callbacks = list(self._subs.get(msg.kind, ()))
+                if not callbacks:
+                    self._pending.append(msg)
+
+            for cb in callbacks:
+                self._deliver(cb, msg)
 
+    @staticmethod
+    def _deliver(callback, msg: Message):
+        try:
+            callback(msg.payload)
+        except Exception:
+            pass                # bir subscriber hatası bus'ı durdurmasın
 
+
+_bus: _Bus | None = None
+
+
+def attach(conn):
+    """
+    launcher.py her process'e Pipe'ın bir ucunu verir.
+    Attach edilmemiş process'ler (ör. pre-commit hook) dosya IPC'ye düşer.
+    """
+    global _bus
+    _bus = _Bus(conn)
+
+
+def connected() -> bool:
+    return _bus is not None
+
+
+def subscribe(kind: str, callback: Callable[[Dict[str, Any]], None]):
+    if _bus is None:
+        raise RuntimeError("IPC bus not attached")
+    _bus.subscribe(kind, callback)
+
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+def _ensure_state_dir():
+    # Import'ta değil, ilk yazmada (pre-commit hook gibi kısa ömürlü
+    # process'ler ipc'yi import edince diske dokunmasın)
+    os.makedirs(STATE_DIR, exist_ok=True)
+
+
+# --------------------------------------------------
+# Commands
+# --------------------------------------------------
 def send_command(cmd: Dict[str, Any]):
+    if _bus is not None:
+        _bus.send(MSG_COMMAND, cmd)
+        return
+
+    _ensure_state_dir()
     with open(CMD_FILE, "w", encoding="utf-8") as f:
         json.dump(cmd, f)
 
@@ -29,12 +152,103 @@ def clear_command():
         os.remove(CMD_FILE)
 
 
+# --------------------------------------------------
+# Status
+# --------------------------------------------------
+# Her kayıt status.log'a {"seq": n, ...} satırı olarak eklenir; progress
+# olayları son özeti ezmez, okuyan taraf yarım kayıt görmez (sadece "\n"
+# ile biten satırlar okunur) ve "seq N'den sonrakiler"i ucuza alabilir.
+def _write_json_atomic(path: str, data: Dict[str, Any]):
+    try:
+        with atomic_write(path, encoding="utf-8") as f:
+            json.dump(data, f)
+    except Exception:
+        pass
+
+
+def _tail_seq(f) -> int:
+    """
+    Açık log'un son tam kaydının seq'i (log boşsa 0).
+    """
+    end = f.seek(0, os.SEEK_END)
+    window = 4096
+    while True:
+        start = max(0, end - window)
+        f.seek(start)
+        lines = f.read(end - start).split(b"\n")
+        # lines[-1]: son "\n"den sonrası (boş ya da yarım kayıt)
+        for line in reversed(lines[:-1]):
+            try:
+                return int(json.loads(line)["seq"])
+            except Exception:
+                continue
+        if start == 0:
+            return 0
+        window *= 4
+
+
+def _compact_status_log(f):
+    f.seek(0)
+    lines = [l for l in f.read().split(b"\n") if l]
+    try:
+        with atomic_write(STATUS_LOG, "wb") as out:
+            out.write(b"\n".join(lines[-STATUS_LOG_KEEP:]) + b"\n")
+    except Exception:
+        pass
+
+
+def _append_status_record(status: Dict[str, Any]) -> int:
+    with open(STATUS_LOG, "ab+") as f:
+        seq = _tail_seq(f) + 1
+        record = {"seq": seq, **status}
+        f.write(json.dumps(record).encode("utf-8") + b"\n")
+        f.flush()
+        if f.tell() > STATUS_LOG_MAX_BYTES:
+            _compact_status_log(f)
+    return seq
+
+
+def _append_status(status: Dict[str, Any]) -> int:
+    _ensure_state_dir()
+    try:
+        import fcntl
+    except ImportError:
+        # Windows: flock yok, kilitsiz yazılır (tek yazan çoğu zaman menü bar)
+        return _append_status_record(status)
+
+    # Log dosyası compaction'da değiştiği için kilit ayrı dosyada
+    with open(STATUS_LOCK, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            return _append_status_record(status)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
 def write_status(status: Dict[str, Any]):
-    with open(STATUS_FILE, "w", encoding="utf-8") as f:
-        json.dump(status, f)
+    # "type"'lı kayıtlar (progress, cancelled, failed) anlık olaydır;
+    # type'sız kayıt tarama özetidir ve status.json'da kalıcı tutulur
+    event = "type" in status
+
+    if _bus is not None:
+        _bus.send(MSG_STATUS, status)
+        # Olaylar sadece canlı; son özet sonradan açılan pencere için de kalsın
+        if event:
+            return
+
+    try:
+        _append_status(status)
+    except OSError:
+        pass
+
+    if not event:
+        _write_json_atomic(STATUS_FILE, status)
 
 
 def read_status() -> Dict[str, Any] | None:
+    """
+    Son tarama özeti (progress vb. olaylar bunu ezmez).
+    """
     if not os.path.exists(STATUS_FILE):
         return None
     try:
@@ -42,3 +256,46 @@ def read_status() -> Dict[str, Any] | None:
             return json.load(f)
     except Exception:
         return None
+
+
+# Okuyucu cursor'ı: (inode, seq, offset) — offset'e kadar her kayıt <= seq
+_cursor: tuple[int, int, int] = (0, 0, 0)
+
+
+def read_status_since(seq: int) -> list[Dict[str, Any]]:
+    """
+    seq'ten sonraki status kayıtları, sırayla. Art arda çağrılarda
+    dosya sadece kalınan yerden okunur. Log sıfırlanmışsa (silindi,
+    seq geri gitti) eldeki tüm kayıtlar döner.
+    """
+    global _cursor
+
+    c_ino, c_seq, c_off = _cursor
+    # Cursor istenen seq'in ilerisindeyse baştan okunmalı
+    res = read_appended(STATUS_LOG, (c_ino, c_off) if c_seq <= seq else (0, 0))
+    if res is None:
+        return []
+
+    records = []
+    for line in res.lines:
+        try:
+            records.append(json.loads(line))
+        except Exception:
+            continue
+
+    ino, offset = res.cursor
+    if records:
+        _cursor = (ino, int(records[-1].get("seq", 0)), offset)
+    last = _cursor[1] if _cursor[0] == ino else 0
+
+    if last < seq and res.reset:
+        return records          # log sıfırlanmış: baştan
+    return [r for r in records if r.get("seq", 0) > seq]
+
+
+def last_status_seq() -> int:
+    try:
+        with open(STATUS_LOG, "rb") as f:
+            return _tail_seq(f)
+    except OSError:
+        return 0
@@ -2,26 +2,55 @@ import multiprocessing
 import sys
 import os
 
+from config import config_snapshot
+
+
+def run_menubar(conn):
+    import ipc
+    ipc.attach(conn)
 
-def run_menubar():
     from app import ZinkxDevAssistant
 
     app = ZinkxDevAssistant()
     app.run()
 
 
-def run_window():
+def run_window(conn):
+    import ipc
+    ipc.attach(conn)
+
     from main_window import run_main_window
 
     run_main_window()
 
 
+def run_scan_daemon():
+    from scan_daemon import run_daemon
+
+    run_daemon()
+
+
 if __name__ == "__main__":
     multiprocessing.set_start_method("spawn", force=True)
 
+    # Menü bar ↔ Qt mesaj kanalı (polling yok)
+    app_conn, window_conn = multiprocessing.Pipe(duplex=True)
+
     # Main window ayrı process
-    p = multiprocessing.Process(target=run_window)
+    p = multiprocessing.Process(target=run_window, args=(window_conn,))
     p.start()
+    window_conn.close()
+
+    # Sıcak cache'li tarama daemon'ı (hook + menü bar bağlanır, yoksa yerel tarar).
+    # daemon=True verilmez: tarama kendi process pool'unu açabilmeli.
+    scand = None
+    if config_snapshot().get("scan_daemon", True):
+        scand = multiprocessing.Process(target=run_scan_daemon, name="zinkx-scand")
+        scand.start()
 
     # Menü bar MAIN THREAD / MAIN PROCESS
-    run_menubar()
+    try:
+        run_menubar(app_conn)
+    finally:
+        if scand is not None:
+            scand.terminate()
@@ -4,11 +4,11 @@ import os
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFileDialog, QListWidget, QListWidgetItem,
+    QFileDialog, QListView,
     QStackedWidget, QProgressBar, QCheckBox,
     QComboBox, QSlider, QFormLayout
 )
-from PySide6.QtCore import Qt, QTimer, QUrl, QSize
+from PySide6.QtCore import Qt, QObject, QTimer, QUrl, QSize, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWidgets import QScrollArea
@@ -16,8 +16,21 @@ from PySide6.QtWidgets import QScrollArea
 import qtawesome as qta
 from qt_material import apply_stylesheet
 
-from ipc import send_command, read_status, read_command, clear_command
-from config import load_config, save_config
+from ipc import (
+    MSG_COMMAND,
+    MSG_STATUS,
+    connected,
+    subscribe,
+    send_command,
+    read_status,
+    read_status_since,
+    last_status_seq,
+    read_command,
+    clear_command,
+)
+from config import config_snapshot, load_config, save_config
+from report_catalog import ReportCatalog
+from reports_model import ReportItemDelegate, ReportListModel
 
 
 # ==================================================
@@ -30,6 +43,45 @@ def apply_theme(app, theme: str):
         apply_stylesheet(app, theme="dark_teal.xml")
 
 
+# ==================================================
+# Progress text
+# ==================================================
+def format_progress(st) -> str:
+    """
+    "Scanning… 1200/5000 files · 340 files/s · 2.1 MB/s · ~12s left · src/app"
+    """
+    parts = [f"Scanning… {st.get('files_done', 0)}/{st.get('files_total', 0)} files"]
+
+    fps = st.get("files_per_sec")
+    if fps:
+        parts.append(f"{fps:.0f} files/s")
+
+    bps = st.get("bytes_per_sec")
+    if bps:
+        parts.append(f"{bps / 1_048_576:.1f} MB/s")
+
+    eta = st.get("eta_sec")
+    if eta is not None:
+        parts.append(f"~{eta:.0f}s left" if eta < 90 else f"~{eta / 60:.0f} min left")
+
+    if st.get("current_dir") and st["current_dir"] != ".":
+        parts.append(st["current_dir"])
+
+    return " · ".join(parts)
+
+
+# ==================================================
+# IPC bridge
+# ==================================================
+class IpcBridge(QObject):
+    """
+    IPC thread'inden gelen mesajları Qt main thread'ine taşır
+    (thread'ler arası emit → queued connection).
+    """
+    status = Signal(object)
+    command = Signal(object)
+
+
 # ==================================================
 # Main Window
 # ==================================================
@@ -51,6 +103,10 @@ class MainWindow(QMainWindow):
         base_dir = os.path.dirname(__file__)
         self.reports_dir = os.path.join(base_dir, "..", "reports")
 
+        # Reports sayfası dizin listesi yerine kataloğu okur
+        self.catalog = ReportCatalog(self.reports_dir)
+        self.catalog.backfill()
+
         icon_path = os.path.join(base_dir, "..", "assets", "icon.png")
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
@@ -60,7 +116,7 @@ class MainWindow(QMainWindow):
         # State
         # --------------------------------------------------
         self.project_path = None
-        self._last_status_hash = None
+        self._status_seq = last_status_seq()
 
         # --------------------------------------------------
         # Root
@@ -207,15 +263,26 @@ class MainWindow(QMainWindow):
             b.clicked.connect(lambda _, x=i: self.switch_page(x))
 
         # --------------------------------------------------
-        # IPC Timers
+        # IPC
         # --------------------------------------------------
-        self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.poll_status)
-        self.status_timer.start(500)
+        if connected():
+            # launcher kanalı: mesajlar geldikçe, polling yok
+            self.ipc = IpcBridge(self)
+            self.ipc.status.connect(self.on_status)
+            self.ipc.command.connect(self.on_command)
+            subscribe(MSG_STATUS, self.ipc.status.emit)
+            subscribe(MSG_COMMAND, self.ipc.command.emit)
+        else:
+            self.status_timer = QTimer(self)
+            self.status_timer.timeout.connect(self.poll_status)
+            self.status_timer.start(500)
 
-        self.cmd_timer = QTimer(self)
-        self.cmd_timer.timeout.connect(self.poll_commands)
-        self.cmd_timer.start(500)
+            self.cmd_timer = QTimer(self)
+            self.cmd_timer.timeout.connect(self.poll_commands)
+            self.cmd_timer.start(500)
+
+        # Pencere açılmadan önceki son tarama özeti
+        self.on_status(read_status())
 
         self.load_reports()
 
@@ -504,23 +571,22 @@ class MainWindow(QMainWindow):
         ll.addWidget(title)
         ll.addWidget(subtitle)
 
-        self.reports_list = QListWidget()
+        # Model/view: satırlar delegate ile çizilir, eski raporlar scroll'da yüklenir
+        icon_dir = os.path.join(os.path.dirname(__file__), "..", "assets", "icons")
+        self.reports_model = ReportListModel(self.catalog, parent=self)
+
+        self.reports_list = QListView()
         self.reports_list.setSpacing(8)
+        self.reports_list.setUniformItemSizes(True)
+        self.reports_list.setModel(self.reports_model)
+        self.reports_list.setItemDelegate(ReportItemDelegate(icon_dir, self.reports_list))
         self.reports_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background:transparent;
                 border:none;
             }
-            QListWidget::item {
-                background:rgba(255,255,255,0.04);
-                border-radius:12px;
-                padding:12px;
-            }
-            QListWidget::item:selected {
-                background:rgba(59,130,246,0.25);
-            }
         """)
-        self.reports_list.itemClicked.connect(self.open_report)
+        self.reports_list.clicked.connect(self.open_report)
 
         ll.addWidget(self.reports_list)
         wrapper.addWidget(left)
@@ -707,69 +773,12 @@ class MainWindow(QMainWindow):
     # Reports
     # ==================================================
     def load_reports(self):
-        self.reports_list.clear()
-
-        if not os.path.isdir(self.reports_dir):
-            return
+        # Sadece katalogdaki yeni raporlar listeye eklenir
+        limit = config_snapshot().get("reports", {}).get("max_recent", 20)
+        self.reports_model.refresh(limit)
 
-        base_dir = os.path.dirname(__file__)
-        icon_dir = os.path.join(base_dir, "..", "assets", "icons")
-
-        for f in sorted(os.listdir(self.reports_dir), reverse=True):
-            if not f.endswith(".html"):
-                continue
-
-            # filename örnek: 2026-01-15_myproject_prod.html
-            parts = f.replace(".html", "").split("_")
-
-            date = parts[0] if len(parts) > 0 else "Unknown date"
-            project = parts[1] if len(parts) > 1 else "Unknown project"
-            mode = parts[2].upper() if len(parts) > 2 else "SCAN"
-
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(320, 74))
-            item.setData(Qt.UserRole, f)
-
-            widget = QWidget()
-            v = QVBoxLayout(widget)
-            v.setContentsMargins(8, 6, 8, 6)
-            v.setSpacing(4)
-
-            # ---- Title row
-            t = QHBoxLayout()
-            icon = QLabel()
-            icon.setPixmap(QIcon(os.path.join(icon_dir, "report.svg")).pixmap(18, 18))
-            t.addWidget(icon)
-
-            t.addWidget(QLabel(f"<b>{project}</b>"))
-            t.addStretch()
-            t.addWidget(QLabel(f"<span style='color:#60a5fa'>{mode}</span>"))
-            v.addLayout(t)
-
-            # ---- Meta row
-            meta = QHBoxLayout()
-
-            clock = QLabel()
-            clock.setPixmap(QIcon(os.path.join(icon_dir, "clock.svg")).pixmap(14, 14))
-            meta.addWidget(clock)
-            meta.addWidget(QLabel(f"<span style='color:#94a3b8;font-size:11px'>{date}</span>"))
-
-            meta.addSpacing(10)
-
-            folder = QLabel()
-            folder.setPixmap(QIcon(os.path.join(icon_dir, "folder.svg")).pixmap(14, 14))
-            meta.addWidget(folder)
-            meta.addWidget(QLabel("<span style='color:#94a3b8;font-size:11px'>Project root</span>"))
-
-            meta.addStretch()
-            v.addLayout(meta)
-
-            self.reports_list.addItem(item)
-            self.reports_list.setItemWidget(item, widget)
-
-
-    def open_report(self, item):
-        filename = item.data(Qt.UserRole)
+    def open_report(self, index):
+        filename = index.data(Qt.UserRole)
         path = os.path.join(self.reports_dir, filename)
         self.report_view.setUrl(QUrl.fromLocalFile(path))
 
@@ -778,7 +787,12 @@ class MainWindow(QMainWindow):
     # IPC
     # ==================================================
     def poll_status(self):
-        st = read_status()
+        # Son okunan seq'ten sonraki tüm kayıtlar, sırayla (progress kaçmaz)
+        for st in read_status_since(self._status_seq):
+            self._status_seq = st.get("seq", self._status_seq)
+            self.on_status(st)
+
+    def on_status(self, st):
         if not st:
             return
 
@@ -786,13 +800,27 @@ class MainWindow(QMainWindow):
         if st.get("type") == "progress":
             self.progress.show()
             self.progress.setValue(st.get("percent", 0))
+
+            # Tarama sürerken o ana kadarki bulgular
+            counts = st.get("counts")
+            if counts:
+                self.lbl_risk.setText(str(counts.get("RISK", 0)))
+                self.lbl_todo.setText(str(counts.get("TODO", 0)))
+
+            if "files_total" in st and st.get("percent", 0) < 100:
+                self.scan_status.setText(format_progress(st))
             return
 
-        key = f"{st.get('last_risks')}|{st.get('last_todos')}|{st.get('mode')}"
-        if key == self._last_status_hash:
+        if st.get("type") == "cancelled":
+            self.progress.hide()
+            self.scan_status.setText("Scan cancelled.")
+            return
+
+        if st.get("type") == "failed":
+            self.progress.hide()
+            self.scan_status.setText(f"Scan failed: {st.get('error', '')}")
             return
 
-        self._last_status_hash = key
         self.progress.setValue(100)
 
         self.lbl_risk.setText(str(st["last_risks"]))
@@ -809,6 +837,10 @@ class MainWindow(QMainWindow):
         cmd = read_command()
         if cmd and cmd.get("action") == "show_window":
             clear_command()
+            self.on_command(cmd)
+
+    def on_command(self, cmd):
+        if cmd.get("action") == "show_window":
             self.show()
             self.raise_()
             self.activateWindow()
@@ -819,7 +851,7 @@ class MainWindow(QMainWindow):
 # ==================================================
 def run_main_window():
     app = QApplication(sys.argv)
-    cfg = load_config()
+    cfg = config_snapshot()
     apply_theme(app, cfg.get("theme", "dark"))
 
     win = MainWindow()
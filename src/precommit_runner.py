@@ -1,39 +1,236 @@
 #!/usr/bin/env python3
-import sys
+import time
+
+_T0 = time.perf_counter()
+
 import os
+import sys
 from pathlib import Path
 
-from scanner import scan_project, SCAN_PROD
-from git_changed import get_changed_files
-from report_html import write_html_report
+from config import config_snapshot
+
+# Ağır modüller (scanner, report_html) sadece gerektiğinde import edilir:
+# temiz ve küçük bir commit'te hook sadece git + config maliyeti öder.
+
+# ZINKX_HOOK_TIMING=1 → startup / scan / toplam süre stderr'e yazılır
+TIMING_ENV = "ZINKX_HOOK_TIMING"
+
+
+def iter_diff_findings(repo_root: Path, cfg, hunks=None, git_env=None):
+    """
+    Sadece staged diff'te eklenen/değişen satırları tarar; bulgular yeni
+    dosyadaki satır numaralarıyla gelir. Maliyet değişiklik boyutuyla
+    orantılı, dosyadaki eski TODO/secret'lar commit'i bloklamaz.
+    git_env: hook dışında çalışırken hook'un index'i (hook_git_env()).
+    """
+    from git_changed import iter_staged_added_lines, staged_files_containing
+    from scanner import (
+        IGNORE_FILE_MARKER,
+        SCAN_PROD,
+        TEXT_EXTS,
+        build_engine,
+        check_env_gitignore,
+        is_scan_candidate,
+        scan_lines,
+    )
+
+    root = str(repo_root)
+    if hunks is None:
+        hunks = list(iter_staged_added_lines(root))
+
+    # .env kontrolü proje seviyesinde: sadece .env/.gitignore stage'lendiyse
+    if {path for path, _ in hunks} & {".env", ".gitignore"}:
+        env_finding = check_env_gitignore(repo_root, cfg)
+        if env_finding is not None:
+            yield env_finding
+
+    hunks = [
+        (path, lines)
+        for path, lines in hunks
+        if lines and is_scan_candidate(path, cfg)
+    ]
+    if not hunks:
+        return
+
+    # Dosya seviyesindeki ignore marker'ı değişmeyen kısımda da olabilir
+    ignored = staged_files_containing(
+        root, IGNORE_FILE_MARKER, [p for p, _ in hunks], git_env=git_env
+    )
+    engine = build_engine(TEXT_EXTS)
+
+    for path, lines in hunks:
+        if path in ignored:
+            continue
+        yield from scan_lines(
+            str(repo_root / path),
+            lines,
+            SCAN_PROD,
+            config=cfg,
+            engine=engine,
+        )
+
+
+def iter_staged_findings(repo_root: Path, cfg):
+    """
+    Stage'lenmiş dosyaların tamamını, diskteki hali yerine index'teki
+    blob'dan tarar (git add -p ile kısmi stage'de commit'e giren içerik).
+    Tüm blob'lar tek bir `git cat-file --batch` process'inden okunur.
+    """
+    from git_changed import GitCatFile, iter_staged_blobs
+    from scanner import (
+        SCAN_PROD,
+        TEXT_EXTS,
+        build_engine,
+        check_env_gitignore,
+        is_scan_candidate,
+        scan_bytes,
+    )
+
+    root = str(repo_root)
+
+    env_finding = check_env_gitignore(repo_root, cfg)
+    if env_finding is not None:
+        yield env_finding
+
+    staged = [
+        (path, sha) for path, sha in iter_staged_blobs(root)
+        if is_scan_candidate(path, cfg)
+    ]
+    if not staged:
+        return
+
+    engine = build_engine(TEXT_EXTS)
+    with GitCatFile(root) as cat:
+        blobs = cat.read_many(sha for _, sha in staged)
+        try:
+            for (path, _), (_, data) in zip(staged, blobs):
+                if data is None:
+                    continue
+                yield from scan_bytes(
+                    str(repo_root / path),
+                    data,
+                    SCAN_PROD,
+                    config=cfg,
+                    engine=engine,
+                )
+        finally:
+            blobs.close()       # fail-fast'te okunmamış blob'lar: git öldürülür
+
+
+def _diff_findings(repo_root: Path, cfg, hunks, fail_fast: bool):
+    # Daemon çalışıyorsa sıcak scanner'da, yoksa burada taranır
+    if cfg.get("scan_daemon", True):
+        from git_changed import hook_git_env
+        from scan_daemon import DaemonUnavailable, remote_precommit
+
+        try:
+            yield from remote_precommit(str(repo_root), hunks, fail_fast, hook_git_env())
+            return
+        except DaemonUnavailable:
+            pass
+
+    yield from iter_diff_findings(repo_root, cfg, hunks)
+
+
+def _open_report(path: str):
+    # Bloklamadan aç; `open` yoksa (macOS dışı) sessizce geç
+    import shutil
+    import subprocess
+
+    opener = shutil.which("open")
+    if opener:
+        subprocess.Popen(
+            [opener, path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+def _print_timing(t_start: float, t_scan: float | None):
+    if not os.environ.get(TIMING_ENV):
+        return
+    now = time.perf_counter()
+    scan = f"{(now - t_scan) * 1000:.1f} ms" if t_scan is not None else "-"
+    print(
+        f"⏱ zinkx hook: startup {(t_start - _T0) * 1000:.1f} ms · "
+        f"scan {scan} · total {(now - _T0) * 1000:.1f} ms",
+        file=sys.stderr,
+    )
 
 
 def main() -> int:
+    t_start = time.perf_counter()
+    t_scan = None
+
     repo_root = Path.cwd()
+    cfg = config_snapshot()
+    fail_fast = cfg.get("precommit_fail_fast", True)
 
-    changed = get_changed_files(str(repo_root))
-    if not changed:
-        print("✔ No changed files. Commit allowed.")
-        return 0
+    if cfg.get("precommit_scan_scope", "diff") == "diff":
+        from git_changed import iter_staged_added_lines
 
-    findings = scan_project(
-        str(repo_root),
-        mode=SCAN_PROD,
-        only_files=changed,
-    )
+        hunks = list(iter_staged_added_lines(str(repo_root)))
+        if not hunks:
+            print("✔ No staged changes. Commit allowed.")
+            _print_timing(t_start, t_scan)
+            return 0
+
+        t_scan = time.perf_counter()
+        scan = _diff_findings(repo_root, cfg, hunks, fail_fast)
+    else:
+        t_scan = time.perf_counter()
+        scan = iter_staged_findings(repo_root, cfg)
+
+    findings = []
+    risks = []
+
+    # Streaming: ilk RISK'te tarama durur (fail_fast)
+    for f in scan:
+        findings.append(f)
+        if f.kind == "RISK":
+            risks.append(f)
+            if fail_fast:
+                scan.close()
+                break
+
+    # Rapor: varsayılan sadece risk varsa (risk | always | never)
+    report = None
+    report_policy = cfg.get("precommit_report", "risk")
+    if report_policy == "always" or (risks and report_policy == "risk"):
+        from report_catalog import record_report
+        from report_html import write_html_report
+        from scanner import SCAN_PROD, count_by_kind, finding_sort_key
 
-    risks = [f for f in findings if f.kind == "RISK"]
+        findings.sort(key=finding_sort_key)
+        report = write_html_report(findings, str(repo_root), out_dir="reports")
 
-    report = write_html_report(findings, str(repo_root), out_dir="reports")
+        record_report(
+            report,
+            str(repo_root),
+            SCAN_PROD,
+            count_by_kind(findings),
+            duration_sec=time.perf_counter() - t_scan,
+        )
 
     if risks:
         print("\n🚨 COMMIT BLOCKED — Security Risks Found")
-        print(f"→ Risks: {len(risks)}")
-        print(f"→ Report: {report}\n")
-        os.system(f"open '{report}'")
+        if fail_fast:
+            print("→ Stopped at first risk (precommit_fail_fast)")
+        else:
+            print(f"→ Risks: {len(risks)}")
+        if report:
+            print(f"→ Report: {report}\n")
+            if cfg.get("precommit_open_report", True):
+                _open_report(str(report))
+        else:
+            for f in risks:
+                print(f"  {f.path}:{f.line or ''}  {f.title}")
+            print()
+        _print_timing(t_start, t_scan)
         return 1
 
     print("✔ Scan clean. Commit allowed.")
+    _print_timing(t_start, t_scan)
     return 0
 
 
@@ -4,7 +4,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
-from scanner import Finding
+from scanner import Finding, finding_sort_key
 
 
 def write_report(findings: Iterable[Finding], project_root: str, out_dir: str) -> Path:
@@ -14,9 +14,17 @@ def write_report(findings: Iterable[Finding], project_root: str, out_dir: str) -
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
     report_file = outp / f"report-{ts}.md"
 
-    risks = [f for f in findings if f.kind == "RISK"]
-    todos = [f for f in findings if f.kind == "TODO"]
-    infos = [f for f in findings if f.kind == "INFO"]
+    # Tek geçiş: findings bir generator (iter_findings) da olabilir
+    risks: list[Finding] = []
+    todos: list[Finding] = []
+    infos: list[Finding] = []
+    buckets = {"RISK": risks, "TODO": todos, "INFO": infos}
+    for f in findings:
+        bucket = buckets.get(f.kind)
+        if bucket is not None:
+            bucket.append(f)
+    for bucket in buckets.values():
+        bucket.sort(key=finding_sort_key)  # zaten sıralıysa O(n)
 
     lines: list[str] = []
     lines.append(f"# Zinkx Dev Assistant — Project Scan\n")
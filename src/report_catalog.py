@@ -0,0 +1,238 @@
+import html
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+from fileio import read_appended
+
+# --------------------------------------------------
+# Catalog file
+# --------------------------------------------------
+# Raporlar dizininde append-only JSONL: her rapor yazıldığında bir satır
+# {"file", "project", "mode", "date", "counts", "duration_sec", "exports"}.
+# Reports sayfası dizini listeleyip dosya adı parse etmek yerine bunu okur.
+CATALOG_FILE = "catalog.jsonl"
+
+REPORT_NAME_RE = re.compile(r"^report-(\d{8})-(\d{6})\.html$")
+
+# report_html head'i: proje + özet kartlarındaki sayılar
+HTML_PROJECT_RE = re.compile(r"<strong>Project:</strong> (.*?)</p>")
+HTML_COUNT_RE = re.compile(r'badge-(risk|todo|info)">\w+</div>\s*<h2>(\d+)</h2>')
+HTML_HEAD_BYTES = 16 * 1024
+
+
+def _catalog_path(reports_dir: str | Path) -> str:
+    return os.path.join(str(reports_dir), CATALOG_FILE)
+
+
+def _append(reports_dir: str | Path, records: Iterable[Dict[str, Any]]):
+    data = "".join(
+        json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for r in records
+    ).encode("utf-8")
+    if not data:
+        return
+    # O_APPEND + tek write: hook ve menü bar aynı anda yazsa da satırlar karışmaz
+    fd = os.open(_catalog_path(reports_dir), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def record_report(
+    report_file: str | Path,
+    project: str,
+    mode: str,
+    counts: Dict[str, int],
+    duration_sec: float | None = None,
+    exports: Iterable[str | Path] = (),
+) -> Dict[str, Any]:
+    """
+    Rapor yazıldıktan sonra kataloğa ekler (rapor ile aynı dizine).
+    """
+    report_file = Path(report_file)
+    record = {
+        "file": report_file.name,
+        "project": project,
+        "mode": mode,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "counts": dict(counts),
+        "duration_sec": None if duration_sec is None else round(duration_sec, 2),
+        "exports": [Path(p).name for p in exports],
+    }
+    try:
+        _append(report_file.parent, [record])
+    except OSError:
+        pass                # katalog yazılamasa da rapor geçerli
+    return record
+
+
+# --------------------------------------------------
+# Backfill (katalogdan önceki raporlar)
+# --------------------------------------------------
+def _read_export_meta(jsonl_path: str) -> Dict[str, Any]:
+    """
+    export.write_jsonl çıktısının başlık + özet satırları (ilk ve son satır).
+    """
+    meta: Dict[str, Any] = {}
+    try:
+        with open(jsonl_path, "rb") as f:
+            head = f.readline()
+            end = f.seek(0, os.SEEK_END)
+            f.seek(max(0, end - 4096))
+            tail = f.read().rstrip(b"\n").rsplit(b"\n", 1)[-1]
+    except OSError:
+        return meta
+
+    for line in (head, tail):
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(rec, dict) and "type" in rec:
+            meta.update(rec)
+    return meta
+
+
+def _read_html_meta(html_path: str) -> Dict[str, Any]:
+    """
+    Export'u olmayan eski raporlar için: proje ve sayılar HTML head'inden.
+    """
+    try:
+        with open(html_path, "r", encoding="utf-8", errors="replace") as f:
+            head = f.read(HTML_HEAD_BYTES)
+    except OSError:
+        return {}
+
+    meta: Dict[str, Any] = {}
+    m = HTML_PROJECT_RE.search(head)
+    if m:
+        meta["project"] = html.unescape(m.group(1))
+    counts = {kind.upper(): int(n) for kind, n in HTML_COUNT_RE.findall(head)}
+    if counts:
+        meta["counts"] = counts
+    return meta
+
+
+def _backfill_record(reports_dir: str, name: str) -> Dict[str, Any]:
+    path = os.path.join(reports_dir, name)
+    m = REPORT_NAME_RE.match(name)
+    if m:
+        date = datetime.strptime(m.group(1) + m.group(2), "%Y%m%d%H%M%S")
+    else:
+        date = datetime.fromtimestamp(os.path.getmtime(path))
+
+    stem = os.path.splitext(name)[0]
+    exports = [
+        f"{stem}.{ext}" for ext in ("jsonl", "sarif")
+        if os.path.exists(os.path.join(reports_dir, f"{stem}.{ext}"))
+    ]
+    if f"{stem}.jsonl" in exports:
+        meta = _read_export_meta(os.path.join(reports_dir, f"{stem}.jsonl"))
+    else:
+        meta = _read_html_meta(path)
+
+    return {
+        "file": name,
+        "project": meta.get("project"),
+        "mode": meta.get("mode"),
+        "date": date.isoformat(timespec="seconds"),
+        "counts": meta.get("counts") or {},
+        "duration_sec": None,
+        "exports": exports,
+    }
+
+
+# --------------------------------------------------
+# Reader
+# --------------------------------------------------
+class ReportCatalog:
+    """
+    Kataloğun artımlı okuyucusu: refresh() sadece son okunan yerden
+    sonraki tam satırları okur. Katalog silinmiş/yeniden yazılmışsa
+    (inode değişti, dosya küçüldü) baştan okunur.
+    """
+
+    def __init__(self, reports_dir: str | Path):
+        self.reports_dir = str(reports_dir)
+        self.path = _catalog_path(self.reports_dir)
+        self.entries: list[Dict[str, Any]] = []
+        self._cursor: tuple[int, int] = (0, 0)     # (inode, offset)
+
+    def backfill(self) -> int:
+        """
+        Katalog hiç yoksa dizindeki mevcut HTML raporlardan bir kez üretir
+        (proje/mode/sayılar yanındaki .jsonl export'tan ya da HTML
+        head'inden, tarih dosya adından). Katalog varsa hiçbir şey yapmaz.
+        """
+        if os.path.exists(self.path) or not os.path.isdir(self.reports_dir):
+            return 0
+
+        records = [
+            _backfill_record(self.reports_dir, name)
+            for name in os.listdir(self.reports_dir)
+            if name.endswith(".html")
+        ]
+        records.sort(key=lambda r: r["date"])
+        try:
+            _append(self.reports_dir, records)
+        except OSError:
+            return 0
+        return len(records)
+
+    def refresh(self) -> list[Dict[str, Any]]:
+        """
+        Son çağrıdan bu yana eklenen kayıtlar (eski → yeni). Katalog baştan
+        okunduysa entries yeni bir liste olur (okuyanlar kimlikten anlar).
+        """
+        res = read_appended(self.path, self._cursor)
+        if res is None:
+            return []
+        if res.reset:
+            self.entries = []
+
+        added = []
+        for line in res.lines:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict) and rec.get("file"):
+                added.append(rec)
+
+        self._cursor = res.cursor
+        self.entries.extend(added)
+        return added
+
+    def iter_recent(
+        self,
+        start: int = 0,
+        end: int | None = None,
+        seen: set[str] | None = None,
+    ) -> Iterator[tuple[int, Dict[str, Any]]]:
+        """
+        entries[start:end]'i en yeniden eskiye gezer: dosyası hâlâ duran
+        raporlar, her dosya bir kez → (entries index'i, kayıt). Gezilen
+        her dosya adı seen'e eklenir; önceden seen'de olanlar atlanır.
+        Dosya varlığı lazy kontrol edilir: sadece istenen kadar stat.
+        """
+        if seen is None:
+            seen = set()
+        if end is None:
+            end = len(self.entries)
+
+        for i in range(end - 1, start - 1, -1):
+            rec = self.entries[i]
+            name = rec["file"]
+            if name in seen:
+                continue
+            seen.add(name)
+            if os.path.exists(self.report_path(rec)):
+                yield i, rec
+
+    def report_path(self, rec: Dict[str, Any]) -> str:
+        return os.path.join(self.reports_dir, rec["file"])
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Sequence
 from datetime import datetime
+from html import escape
+from json.encoder import encode_basestring
+from itertools import pairwise
 from pathlib import Path
 from typing import Iterable
 
-from scanner import Finding
+from config import ConfigSnapshot, config_snapshot
+from fileio import WRITE_BUFFER
+from scanner import Finding, FindingStore, count_by_kind, finding_sort_key
 
+# Layout: cards = her bulgu statik kart, virtual = JSON veri + sanal liste
+LAYOUT_CARDS = "cards"
+LAYOUT_VIRTUAL = "virtual"
+VIRTUAL_THRESHOLD = 2000
 
-HTML_TEMPLATE = """<!doctype html>
+
+# Rapor parça parça yazılır: head (sayılar) → kartlar → foot
+HTML_HEAD = """<!doctype html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
@@ -109,10 +122,9 @@ footer {{
     <h2>{info_count}</h2>
   </div>
 </div>
+"""
 
-{sections}
-
-<footer>
+HTML_FOOT = """<footer>
 Generated by Zinkx Dev Assistant
 </footer>
 
@@ -121,54 +133,318 @@ Generated by Zinkx Dev Assistant
 """
 
 
-def _section(title: str, kind: str, items: list[Finding]) -> str:
-    if not items:
-        return ""
+SECTIONS = {
+    "RISK": "🚨 Risks",
+    "TODO": "🧩 TODO / FIXME",
+    "INFO": "ℹ️ Info",
+}
 
-    rows = []
-    for f in items:
-        if f.line:
-            link = f"vscode://file/{f.path}:{f.line}"
-            path = f'<a href="{link}">{f.path}:{f.line}</a>'
-        else:
-            path = f.path
+# Sanal liste: sadece görünen satırlar DOM'da; satır yüksekliği sabit
+# (CSS .vrow height + margin == ROW_H)
+VIRTUAL_BODY = """<style>
+.vtools {
+  display: flex;
+  gap: 16px;
+  align-items: center;
+  margin-bottom: 12px;
+}
+.vtools input[type=search] {
+  flex: 1;
+  padding: 8px 12px;
+  background: var(--panel);
+  color: var(--text);
+  border: 1px solid var(--border);
+  border-radius: 8px;
+}
+.vtools label, #vshown {
+  color: var(--muted);
+  font-size: 13px;
+}
+#vlist {
+  position: relative;
+  height: calc(100vh - 120px);
+  min-height: 400px;
+  overflow-y: auto;
+}
+#vview {
+  position: absolute;
+  top: 0;
+  left: 0;
+  right: 0;
+}
+.vrow {
+  height: 88px;
+  margin-bottom: 8px;
+  padding: 10px 16px;
+  overflow: hidden;
+}
+.vrow p, .vrow .path {
+  margin: 6px 0;
+  white-space: nowrap;
+  overflow: hidden;
+  text-overflow: ellipsis;
+  word-break: normal;
+}
+</style>
+
+<div class="vtools">
+  <input id="vsearch" type="search" placeholder="Search detail or path…">
+  <label><input class="vkind" type="checkbox" value="RISK" checked> RISK</label>
+  <label><input class="vkind" type="checkbox" value="TODO" checked> TODO</label>
+  <label><input class="vkind" type="checkbox" value="INFO" checked> INFO</label>
+  <span id="vshown"></span>
+</div>
+
+<div id="vlist"><div id="vspacer"></div><div id="vview"></div></div>
+"""
+
+VIRTUAL_SCRIPT = """<script>
+(function () {
+  var ROW_H = 96, OVERSCAN = 8;
+  var data = JSON.parse(document.getElementById("zinkx-data").textContent);
+  var rows = data.rows, paths = data.paths, kinds = data.kinds;
+
+  var list = document.getElementById("vlist");
+  var spacer = document.getElementById("vspacer");
+  var view = document.getElementById("vview");
+  var search = document.getElementById("vsearch");
+  var shown = document.getElementById("vshown");
+  var boxes = Array.prototype.slice.call(document.querySelectorAll(".vkind"));
+
+  var visible = [], lowered = [], range = "";
+
+  // Arama metni ilk aramada, satır başına bir kez küçültülür
+  function haystack(i) {
+    var h = lowered[i];
+    if (h === undefined) {
+      h = lowered[i] = (rows[i][3] + " " + paths[rows[i][1]]).toLowerCase();
+    }
+    return h;
+  }
+
+  function applyFilter() {
+    var q = search.value.trim().toLowerCase();
+    var on = {};
+    boxes.forEach(function (b) { on[b.value] = b.checked; });
+
+    visible = [];
+    for (var i = 0; i < rows.length; i++) {
+      if (!on[kinds[rows[i][0]]]) continue;
+      if (q && haystack(i).indexOf(q) < 0) continue;
+      visible.push(i);
+    }
+
+    spacer.style.height = (visible.length * ROW_H) + "px";
+    shown.textContent = visible.length + " / " + rows.length;
+    list.scrollTop = 0;
+    range = "";
+    render();
+  }
+
+  // Veri sadece textContent ile DOM'a girer (escape gerekmez)
+  function card(i) {
+    var r = rows[i], kind = kinds[r[0]].toLowerCase(), path = paths[r[1]];
+
+    var el = document.createElement("div");
+    el.className = "card vrow";
+
+    var badge = document.createElement("span");
+    badge.className = "badge badge-" + kind;
+    badge.textContent = kind;
+
+    var detail = document.createElement("p");
+    detail.textContent = r[3];
+
+    var loc = document.createElement("div");
+    loc.className = "path";
+    if (r[2]) {
+      var a = document.createElement("a");
+      a.href = "vscode://file/" + path + ":" + r[2];
+      a.textContent = path + ":" + r[2];
+      loc.appendChild(a);
+    } else {
+      loc.textContent = path;
+    }
+
+    el.appendChild(badge);
+    el.appendChild(detail);
+    el.appendChild(loc);
+    return el;
+  }
 
-        rows.append(f"""
+  function render() {
+    var first = Math.max(0, Math.floor(list.scrollTop / ROW_H) - OVERSCAN);
+    var last = Math.min(
+      visible.length,
+      Math.ceil((list.scrollTop + list.clientHeight) / ROW_H) + OVERSCAN
+    );
+    if (first + ":" + last === range) return;
+    range = first + ":" + last;
+
+    var frag = document.createDocumentFragment();
+    for (var j = first; j < last; j++) frag.appendChild(card(visible[j]));
+    view.style.transform = "translateY(" + (first * ROW_H) + "px)";
+    view.replaceChildren(frag);
+  }
+
+  var queued = false;
+  list.addEventListener("scroll", function () {
+    if (queued) return;
+    queued = true;
+    requestAnimationFrame(function () { queued = false; render(); });
+  });
+
+  var timer = null;
+  search.addEventListener("input", function () {
+    clearTimeout(timer);
+    timer = setTimeout(applyFilter, 150);
+  });
+  boxes.forEach(function (b) { b.addEventListener("change", applyFilter); });
+  window.addEventListener("resize", function () { range = ""; render(); });
+
+  applyFilter();
+})();
+</script>
+"""
+
+
+def _card(f: Finding, paths: dict[str, str]) -> str:
+    # Aynı path çok kez tekrarlanır: escape edilmiş hali rapor başına bir kez
+    path = paths.get(f.path)
+    if path is None:
+        path = paths[f.path] = escape(f.path)
+
+    if f.line:
+        path = f'<a href="vscode://file/{path}:{f.line}">{path}:{f.line}</a>'
+
+    badge = f.kind.lower()
+    return f"""
         <div class="card">
-          <span class="badge badge-{kind.lower()}">{kind}</span>
-          <p>{f.detail}</p>
+          <span class="badge badge-{badge}">{badge}</span>
+          <p>{escape(f.detail, quote=False)}</p>
           <div class="path">{path}</div>
         </div>
-        """)
+"""
+
+
+def _in_report_order(findings: Iterable[Finding]) -> Sequence[Finding]:
+    """
+    Kartlar tek geçişte yazılır: bulgular finding_sort_key sırasında olmalı.
+    scan_project zaten sıralı döner; generator kompakt depoya alınıp sıralanır.
+    """
+    if isinstance(findings, FindingStore):
+        if findings.is_sorted():
+            return findings
+        findings = FindingStore(findings)
+    elif isinstance(findings, Sequence):
+        keys = map(finding_sort_key, findings)
+        if all(a <= b for a, b in pairwise(keys)):
+            return findings
+        return sorted(findings, key=finding_sort_key)
+    else:
+        findings = FindingStore(findings)
+
+    findings.sort()
+    return findings
+
+
+def _json(value) -> str:
+    # <script> içine gömülür: "</script>" ya da "<!--" veriyi kapatamasın
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).replace("<", "\\u003c")
 
-    return f"<h2>{title}</h2>" + "\n".join(rows)
 
+def _write_cards(out, findings: Sequence[Finding]):
+    # Sıralı akışta her kind bir blok: başlık blok başında yazılır
+    current = title = None
+    paths: dict[str, str] = {}
+    for f in findings:
+        if f.kind != current:
+            current = f.kind
+            title = SECTIONS.get(current)
+            if title is not None:
+                out.write(f"<h2>{title}</h2>\n")
+        if title is not None:
+            out.write(_card(f, paths))
+
+
+def _write_virtual(out, findings: Sequence[Finding]):
+    """
+    Bulgular tek bir JSON bloğu olarak gömülür: [kind, path, line, detail]
+    satırları, path'ler ayrı tabloda tekil. Kartları tarayıcıdaki script
+    sadece görünen aralık için üretir.
+    """
+    kinds = list(SECTIONS)
+    kind_ids = {k: i for i, k in enumerate(kinds)}
+    path_ids: dict[str, int] = {}
+
+    out.write(VIRTUAL_BODY)
+    out.write('<script id="zinkx-data" type="application/json">{"rows":[')
+
+    sep = ""
+    for f in findings:
+        k = kind_ids.get(f.kind)
+        if k is None:
+            continue
+        p = path_ids.get(f.path)
+        if p is None:
+            p = path_ids[f.path] = len(path_ids)
+        detail = encode_basestring(f.detail).replace("<", "\\u003c")
+        out.write(f"{sep}[{k},{p},{f.line or 0},{detail}]")
+        sep = ","
+
+    # Path tablosu satırlardan sonra: tek geçişte toplanır
+    out.write(f'],"paths":{_json(list(path_ids))},"kinds":{_json(kinds)}}}</script>\n')
+    out.write(VIRTUAL_SCRIPT)
+
+
+def _pick_layout(counts: dict[str, int], cfg) -> str:
+    threshold = int(cfg.get("reports", {}).get("html_virtual_threshold", VIRTUAL_THRESHOLD))
+    total = sum(counts.get(k, 0) for k in SECTIONS)
+    if threshold and total > threshold:
+        return LAYOUT_VIRTUAL
+    return LAYOUT_CARDS
+
+
+def write_html_report(
+    findings: Iterable[Finding],
+    project_root: str,
+    out_dir: str,
+    layout: str | None = None,
+    config: ConfigSnapshot | None = None,
+) -> Path:
+    """
+    Rapor buffer'lı dosyaya akış halinde yazılır; bellekte tam HTML
+    string'i hiç oluşmaz. Sayılar head'e yazılmak için önceden sayılır.
+    layout verilmezse bulgu sayısı reports.html_virtual_threshold'u
+    geçince sanal liste (LAYOUT_VIRTUAL), altında statik kartlar.
+    """
+    cfg = config if config is not None else config_snapshot()
 
-def write_html_report(findings: Iterable[Finding], project_root: str, out_dir: str) -> Path:
     outp = Path(out_dir).expanduser().resolve()
     outp.mkdir(parents=True, exist_ok=True)
 
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
     report_file = outp / f"report-{ts}.html"
 
-    risks = [f for f in findings if f.kind == "RISK"]
-    todos = [f for f in findings if f.kind == "TODO"]
-    infos = [f for f in findings if f.kind == "INFO"]
-
-    sections = (
-        _section("🚨 Risks", "risk", risks) +
-        _section("🧩 TODO / FIXME", "todo", todos) +
-        _section("ℹ️ Info", "info", infos)
-    )
-
-    html = HTML_TEMPLATE.format(
-        project=project_root,
-        date=datetime.now().isoformat(timespec="seconds"),
-        risk_count=len(risks),
-        todo_count=len(todos),
-        info_count=len(infos),
-        sections=sections,
-    )
-
-    report_file.write_text(html, encoding="utf-8")
+    findings = _in_report_order(findings)
+    counts = count_by_kind(findings)
+    if layout is None:
+        layout = _pick_layout(counts, cfg)
+
+    with open(report_file, "w", encoding="utf-8", buffering=WRITE_BUFFER) as out:
+        out.write(HTML_HEAD.format(
+            project=escape(project_root),
+            date=datetime.now().isoformat(timespec="seconds"),
+            risk_count=counts.get("RISK", 0),
+            todo_count=counts.get("TODO", 0),
+            info_count=counts.get("INFO", 0),
+        ))
+
+        if layout == LAYOUT_VIRTUAL:
+            _write_virtual(out, findings)
+        else:
+            _write_cards(out, findings)
+
+        out.write(HTML_FOOT)
+
     return report_file
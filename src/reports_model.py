@@ -0,0 +1,297 @@
+import os
+from typing import Any, Dict, NamedTuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QIcon, QPainter
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+from report_catalog import ReportCatalog
+
+# fetchMore başına view'a verilen satır (scroll'da devamı gelir)
+FETCH_BATCH = 200
+
+ROW_SIZE = QSize(320, 74)
+
+RecordRole = Qt.UserRole + 1       # ham katalog kaydı
+DisplayRowRole = Qt.UserRole + 2   # delegate için hazır metinler
+
+
+class ReportRow(NamedTuple):
+    project: str
+    mode: str
+    date: str
+    counts: str
+
+
+def _display_row(rec: Dict[str, Any]) -> ReportRow:
+    counts = rec.get("counts") or {}
+    return ReportRow(
+        project=os.path.basename(rec.get("project") or "") or "Unknown project",
+        mode=(rec.get("mode") or "scan").upper(),
+        date=(rec.get("date") or "Unknown date").replace("T", " ")[:16],
+        counts=f"{counts.get('RISK', 0)} risk · {counts.get('TODO', 0)} todo",
+    )
+
+
+def _tooltip(rec: Dict[str, Any]) -> str:
+    tip = rec.get("project") or ""
+    if rec.get("duration_sec") is not None:
+        tip += f"\nScan: {rec['duration_sec']:.1f}s"
+    return tip.strip()
+
+
+# ==================================================
+# Model
+# ==================================================
+class ReportListModel(QAbstractListModel):
+    """
+    Rapor kataloğu üzerinde liste modeli (en yeni üstte).
+
+    refresh() kataloğun sadece yeni satırlarını okur ve bunları başa
+    ekler; liste yeniden kurulmaz. Eski kayıtlar view scroll ettikçe
+    FETCH_BATCH'lik parçalarla yüklenir (canFetchMore / fetchMore).
+    Dosya varlığı sadece yüklenen satırlar için kontrol edilir.
+    limit: reports.max_recent (0/None = sınırsız).
+    """
+
+    def __init__(self, catalog: ReportCatalog, limit: int | None = None, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.limit = limit or None
+
+        self._rows: list[Dict[str, Any]] = []
+        self._display: list[ReportRow] = []
+        self._files: set[str] = set()
+
+        self._entries: list[Dict[str, Any]] = catalog.entries
+        self._top = 0          # bu index'ten sonraki katalog kayıtları henüz görülmedi
+        self._older = 0        # bu index'ten önceki kayıtlar fetchMore'u bekliyor
+
+    # --------------------------------------------------
+    # Qt model API
+    # --------------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+
+        rec = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self._display[index.row()].project
+        if role == Qt.UserRole:
+            return rec["file"]
+        if role == Qt.ToolTipRole:
+            return _tooltip(rec)
+        if role == RecordRole:
+            return rec
+        if role == DisplayRowRole:
+            return self._display[index.row()]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._older > 0 and not self._full()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+
+        batch: list[Dict[str, Any]] = []
+        want = FETCH_BATCH
+        if self.limit:
+            want = min(want, self.limit - len(self._rows))
+
+        older = 0
+        for i, rec in self.catalog.iter_recent(end=self._older, seen=set(self._files)):
+            batch.append(rec)
+            if len(batch) >= want:
+                older = i
+                break
+        self._older = older
+
+        if batch:
+            self._insert(len(self._rows), batch)
+
+    # --------------------------------------------------
+    # Catalog
+    # --------------------------------------------------
+    def refresh(self, limit: int | None = None):
+        """
+        Kataloğu artımlı okur; yeni raporlar listenin başına eklenir.
+        limit değişirse liste baştan kurulur.
+        """
+        if limit is not None and (limit or None) != self.limit:
+            self.limit = limit or None
+            self._reset()
+            return
+
+        self.catalog.refresh()
+        if self.catalog.entries is not self._entries:
+            self._reset()               # katalog baştan okundu
+            return
+
+        first, top = self._top == 0, self._top
+        self._top = len(self._entries)
+
+        if first:
+            # İlk yükleme: hepsi "eski" kayıt, ilk parça hemen, devamı scroll'da
+            self._older = self._top
+            self.fetchMore()
+        elif top < self._top:
+            self._prepend(top)
+
+        self._trim()
+
+    def _reset(self):
+        self.beginResetModel()
+        self._rows, self._display, self._files = [], [], set()
+        self._entries = self.catalog.entries
+        self._top = self._older = 0
+        self.endResetModel()
+        self.refresh()
+
+    def _prepend(self, start: int):
+        # entries[start:] yeni kayıtlar
+        seen: set[str] = set()
+        batch = [rec for _, rec in self.catalog.iter_recent(start=start, seen=seen)]
+
+        # Aynı rapor tekrar kaydedildiyse eski satırı kaldır, en üste taşı
+        for name in seen & self._files:
+            self._remove(next(i for i, r in enumerate(self._rows) if r["file"] == name))
+
+        if batch:
+            self._insert(0, batch)
+
+    def _trim(self):
+        if self.limit and len(self._rows) > self.limit:
+            first = self.limit
+            self.beginRemoveRows(QModelIndex(), first, len(self._rows) - 1)
+            for rec in self._rows[first:]:
+                self._files.discard(rec["file"])
+            del self._rows[first:]
+            del self._display[first:]
+            self.endRemoveRows()
+
+    # --------------------------------------------------
+    # Helpers
+    # --------------------------------------------------
+    def _full(self) -> bool:
+        return bool(self.limit) and len(self._rows) >= self.limit
+
+    def _insert(self, row: int, batch: list[Dict[str, Any]]):
+        self.beginInsertRows(QModelIndex(), row, row + len(batch) - 1)
+        self._rows[row:row] = batch
+        self._display[row:row] = [_display_row(r) for r in batch]
+        self._files.update(r["file"] for r in batch)
+        self.endInsertRows()
+
+    def _remove(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._files.discard(self._rows[row]["file"])
+        del self._rows[row]
+        del self._display[row]
+        self.endRemoveRows()
+
+
+# ==================================================
+# Delegate
+# ==================================================
+class ReportItemDelegate(QStyledItemDelegate):
+    """
+    Satır başına widget yerine doğrudan çizer. İkonlar delegate
+    kurulurken bir kez pixmap'e çevrilir, font'lar da bir kez türetilir.
+    """
+
+    BG = QColor(255, 255, 255, 10)
+    BG_SELECTED = QColor(59, 130, 246, 64)
+    MODE = QColor("#60a5fa")
+    MUTED = QColor("#94a3b8")
+    RADIUS = 12
+
+    def __init__(self, icon_dir: str, parent=None):
+        super().__init__(parent)
+        self.icons = {
+            "report": QIcon(os.path.join(icon_dir, "report.svg")).pixmap(18, 18),
+            "clock": QIcon(os.path.join(icon_dir, "clock.svg")).pixmap(14, 14),
+            "folder": QIcon(os.path.join(icon_dir, "folder.svg")).pixmap(14, 14),
+        }
+        self._fonts: tuple[QFont, QFont, QFont] | None = None
+
+    def _fonts_for(self, base: QFont) -> tuple[QFont, QFont, QFont]:
+        if self._fonts is None:
+            base = QFont(base)          # option.font paint sonrası silinir
+            bold = QFont(base)
+            bold.setBold(True)
+            small = QFont(base)
+            small.setPixelSize(11)
+            self._fonts = (base, bold, small)
+        return self._fonts
+
+    def sizeHint(self, option, index) -> QSize:
+        return ROW_SIZE
+
+    def paint(self, painter: QPainter, option, index):
+        row: ReportRow | None = index.data(DisplayRowRole)
+        if row is None:
+            return
+
+        base, bold, small = self._fonts_for(option.font)
+        text = option.palette.text().color()
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # ---- Card
+        r = option.rect
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.BG_SELECTED if option.state & QStyle.State_Selected else self.BG)
+        painter.drawRoundedRect(r, self.RADIUS, self.RADIUS)
+
+        inner = r.adjusted(20, 18, -20, -12)     # item padding + içerik margin
+
+        # ---- Title row: ikon, proje, mode
+        painter.drawPixmap(inner.left(), inner.top(), self.icons["report"])
+
+        painter.setFont(base)
+        painter.setPen(self.MODE)
+        mode_w = QFontMetrics(base).horizontalAdvance(row.mode)
+        title_h = 20
+        painter.drawText(
+            QRect(inner.right() - mode_w, inner.top(), mode_w, title_h),
+            Qt.AlignRight | Qt.AlignVCenter,
+            row.mode,
+        )
+
+        painter.setFont(bold)
+        painter.setPen(text)
+        x = inner.left() + 26
+        project = QFontMetrics(bold).elidedText(
+            row.project, Qt.ElideRight, max(0, inner.right() - mode_w - 12 - x)
+        )
+        painter.drawText(QRect(x, inner.top(), inner.right() - x, title_h),
+                         Qt.AlignLeft | Qt.AlignVCenter, project)
+
+        # ---- Meta row: tarih, sayılar
+        y = inner.top() + title_h + 6
+        meta_h = 16
+        fm = QFontMetrics(small)
+        painter.setFont(small)
+        painter.setPen(self.MUTED)
+
+        x = inner.left()
+        painter.drawPixmap(x, y + 1, self.icons["clock"])
+        x += 20
+        painter.drawText(QRect(x, y, fm.horizontalAdvance(row.date), meta_h),
+                         Qt.AlignLeft | Qt.AlignVCenter, row.date)
+        x += fm.horizontalAdvance(row.date) + 10
+
+        painter.drawPixmap(x, y + 1, self.icons["folder"])
+        x += 20
+        painter.drawText(QRect(x, y, max(0, inner.right() - x), meta_h),
+                         Qt.AlignLeft | Qt.AlignVCenter,
+                         fm.elidedText(row.counts, Qt.ElideRight, max(0, inner.right() - x)))
+
+        painter.restore()
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable
+
+# --------------------------------------------------
+# Severity keys (scanner.SCAN_DEV / SCAN_PROD ile aynı)
+# --------------------------------------------------
+DEV = "dev"
+PROD = "prod"
+
+# Kural motoru (pattern dışı mantık) değişirse artır → scan cache geçersiz olur
+RULES_VERSION = 4
+
+# --------------------------------------------------
+# Security patterns
+# --------------------------------------------------
+SECRET_PATTERNS = [
+    re.compile(r"(api[_-]?key|secret|token|password)\s*=\s*['\"][^'\"]+['\"]", re.I),
+    re.compile(r"(api[_-]?key|secret|token|password)\s*:\s*['\"][^'\"]+['\"]", re.I),
+]
+
+EMAIL_PATTERN = re.compile(
+    r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
+)
+
+# re.I bu karakterleri ASCII harflerle eşler ama lower() eşlemez;
+# metinde varsa anchor araması re.I ile orijinal metinde yapılır.
+CASEFOLD_ODD = ("ı", "ſ")
+
+
+# --------------------------------------------------
+# Rule model
+# --------------------------------------------------
+@dataclass(frozen=True)
+class Rule:
+    """
+    Satır bazlı, declarative kural.
+
+    anchors: lowercase regex alternation. Satırda geçmiyorsa kural hiç
+    değerlendirilmez; dosyada hiçbir kuralın anchor'ı yoksa dosya prefilter'a
+    takılır. Bu yüzden anchor, kuralın eşleştiği her satırda bulunmalı.
+    """
+    id: str
+    title: str
+    anchors: str
+    severity: Dict[str, str]                    # {"dev": ..., "prod": ...}
+    exts: frozenset[str] | None = None          # None → tüm TEXT_EXTS
+    patterns: tuple[re.Pattern, ...] = ()       # en az biri satırda search etmeli
+    any_of: tuple[str, ...] = ()                # lower satırda en az biri geçmeli
+    all_of: tuple[str, ...] = ()                # lower satırda hepsi geçmeli
+    skip_names: tuple[str, ...] = ()            # lower dosya adında geçerse atla
+
+    def applies_to(self, ext: str, name_low: str) -> bool:
+        if self.exts is not None and ext not in self.exts:
+            return False
+        return not any(s in name_low for s in self.skip_names)
+
+    def matches(self, line: str, low: str) -> bool:
+        if self.any_of and not any(s in low for s in self.any_of):
+            return False
+        if self.all_of and not all(s in low for s in self.all_of):
+            return False
+        if self.patterns and not any(p.search(line) for p in self.patterns):
+            return False
+        return True
+
+    def severity_for(self, mode: str) -> str:
+        return self.severity.get(mode) or self.severity[DEV]
+
+
+# --------------------------------------------------
+# Built-in rules (sıra = aynı satırdaki bulguların sırası)
+# --------------------------------------------------
+_PHP = frozenset({".php"})
+_RISK_IN_PROD = {DEV: "INFO", PROD: "RISK"}
+
+RULES: list[Rule] = [
+    Rule(
+        id="todo",
+        title="TODO/FIXME found",
+        anchors=r"todo|fixme",
+        severity={DEV: "TODO", PROD: "TODO"},
+        any_of=("todo", "fixme"),
+    ),
+    Rule(
+        id="php.secret",
+        title="Hardcoded secret",
+        anchors=r"api[_-]?key|secret|token|password",
+        severity=_RISK_IN_PROD,
+        exts=_PHP,
+        patterns=tuple(SECRET_PATTERNS),
+    ),
+    Rule(
+        id="php.email",
+        title="Hardcoded email",
+        anchors=r"@",
+        severity={DEV: "INFO", PROD: "INFO"},
+        exts=_PHP,
+        patterns=(EMAIL_PATTERN,),
+        skip_names=(".env",),
+    ),
+    Rule(
+        id="php.display_errors",
+        title="display_errors enabled",
+        anchors=r"display_errors",
+        severity=_RISK_IN_PROD,
+        exts=_PHP,
+        all_of=("display_errors", "ini_set"),
+    ),
+    Rule(
+        id="php.error_reporting",
+        title="error_reporting(E_ALL)",
+        anchors=r"error_reporting",
+        severity=_RISK_IN_PROD,
+        exts=_PHP,
+        all_of=("error_reporting", "e_all"),
+    ),
+]
+
+
+def register_rule(rule: Rule):
+    """
+    Kural ekler (aynı id varsa değiştirir).
+    Process pool worker'ları engine'i scan başında pickle'lanmış olarak
+    aldığı için runtime'da eklenen kurallar da worker'lara ulaşır.
+    """
+    for i, r in enumerate(RULES):
+        if r.id == rule.id:
+            RULES[i] = rule
+            return
+    RULES.append(rule)
+
+
+def rules_fingerprint(rules: Iterable[Rule] | None = None) -> str:
+    """
+    Kural setinin özeti; scan cache key'ine girer.
+    """
+    parts = [str(RULES_VERSION)]
+    for r in (RULES if rules is None else rules):
+        parts.append(repr((
+            r.id,
+            r.title,
+            r.anchors,
+            sorted(r.severity.items()),
+            sorted(r.exts) if r.exts is not None else None,
+            [(p.pattern, p.flags) for p in r.patterns],
+            r.any_of,
+            r.all_of,
+            r.skip_names,
+        )))
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+# --------------------------------------------------
+# Engine
+# --------------------------------------------------
+class RuleGroup:
+    """
+    Bir uzantıya uygulanan kurallar + tek geçişlik birleşik anchor regex'i.
+
+    folded=True  → lower() edilmiş metinde case-sensitive arama (hızlı yol)
+    folded=False → orijinal metinde re.I arama
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = tuple(rules)
+
+        # Grup/lookahead yok: düz alternation, sre'nin en hızlı yolu
+        alts = "|".join(r.anchors for r in self.rules)
+        self.search = {
+            True: re.compile(alts),
+            False: re.compile(alts, re.I),
+        }
+        self.rule_anchors = {
+            True: [re.compile(r.anchors) for r in self.rules],
+            False: [re.compile(r.anchors, re.I) for r in self.rules],
+        }
+
+
+class RuleEngine:
+    """
+    Kuralları scan başında bir kez uzantıya göre gruplar.
+    Aynı kural kümesine düşen uzantılar aynı RuleGroup'u paylaşır.
+    """
+
+    def __init__(self, rules: Iterable[Rule], exts: Iterable[str]):
+        self.rules = tuple(rules)
+        self.fingerprint = rules_fingerprint(self.rules)
+
+        shared: Dict[tuple[str, ...], RuleGroup] = {}
+        self.groups: Dict[str, RuleGroup | None] = {}
+
+        for ext in exts:
+            ids = tuple(
+                r.id for r in self.rules
+                if r.exts is None or ext in r.exts
+            )
+            if not ids:
+                self.groups[ext] = None
+                continue
+            if ids not in shared:
+                shared[ids] = RuleGroup(r for r in self.rules if r.id in ids)
+            self.groups[ext] = shared[ids]
+
+    def group_for(self, ext: str) -> RuleGroup | None:
+        return self.groups.get(ext)
+
+
+def build_engine(exts: Iterable[str]) -> RuleEngine:
+    return RuleEngine(RULES, exts)
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable
+
+from fileio import atomic_write
+
+# --------------------------------------------------
+# Cache path
+# --------------------------------------------------
+CACHE_DIR = os.path.expanduser("~/.zinkx_dev_assistant/cache")
+
+# Cache dosya formatı değişirse artır
+CACHE_FORMAT = 2
+
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+def _digest_file(path: str) -> str | None:
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def make_cache_key(
+    rules_fingerprint: str,
+    ignore_markers: Iterable[str],
+    mode: str,
+) -> str:
+    """
+    Kural seti, inline ignore marker'ları ve scan mode değişince
+    key değişir → eski cache otomatik geçersiz olur.
+    """
+    raw = json.dumps(
+        [CACHE_FORMAT, rules_fingerprint, list(ignore_markers), mode],
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+# --------------------------------------------------
+# Findings cache
+# --------------------------------------------------
+class ScanCache:
+    """
+    Proje + mode başına disk cache.
+    Dosya path + size + mtime (opsiyonel içerik hash'i) eşleşirse
+    önceki taramanın bulguları tekrar kullanılır.
+    """
+
+    def __init__(self, root: str, mode: str, key: str, verify_hash: bool = False):
+        self.root = root
+        self.key = key
+        self.verify_hash = verify_hash
+
+        name = hashlib.sha1(f"{root}|{mode}".encode("utf-8")).hexdigest()
+        self.path = os.path.join(CACHE_DIR, f"{name}.json")
+
+        self.files: Dict[str, list] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    # --------------------------------------------------
+    # Load / save
+    # --------------------------------------------------
+    def load(self) -> "ScanCache":
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except Exception:
+            return self
+
+        if raw.get("key") != self.key or raw.get("root") != self.root:
+            self._dirty = True
+            return self
+
+        self.files = raw.get("files") or {}
+        return self
+
+    def begin(self) -> "ScanCache":
+        """
+        Yeni tarama turu: bellekte tutulan (daemon) cache tekrar
+        kullanılırken prune için "görülen dosyalar" sıfırlanır.
+        """
+        self._seen = set()
+        return self
+
+    def save(self, prune: bool = False):
+        """
+        prune=True → bu taramada görülmeyen (silinmiş) dosyaları at.
+        only_files taramalarında prune edilmez.
+        """
+        if prune:
+            stale = [p for p in self.files if p not in self._seen]
+            for p in stale:
+                del self.files[p]
+            self._dirty = self._dirty or bool(stale)
+
+        if not self._dirty:
+            return
+
+        data: Dict[str, Any] = {
+            "key": self.key,
+            "root": self.root,
+            "files": self.files,
+        }
+
+        try:
+            with atomic_write(self.path, encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        except Exception:
+            return
+
+        self._dirty = False
+
+    # --------------------------------------------------
+    # Lookup / store
+    # --------------------------------------------------
+    def lookup(self, path: str, size: int, mtime_ns: int) -> list[tuple] | None:
+        self._seen.add(path)
+
+        rec = self.files.get(path)
+        if not rec:
+            return None
+
+        c_size, c_mtime, c_digest, rows = rec
+        if c_size != size:
+            return None
+
+        if c_mtime != mtime_ns:
+            # mtime değişti ama içerik aynı olabilir (git checkout, touch)
+            if not (self.verify_hash and c_digest):
+                return None
+            if _digest_file(path) != c_digest:
+                return None
+            rec[1] = mtime_ns
+            self._dirty = True
+
+        return [tuple(r) for r in rows]
+
+    def store(self, path: str, size: int, mtime_ns: int, rows: Iterable[tuple]):
+        """
+        rows: (kind, title, detail, line, rule) tuple'ları
+        """
+        self._seen.add(path)
+
+        digest = _digest_file(path) if self.verify_hash else None
+        self.files[path] = [size, mtime_ns, digest, [list(r) for r in rows]]
+        self._dirty = True
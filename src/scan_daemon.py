@@ -0,0 +1,415 @@
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple
+
+from config import config_snapshot
+from ipc import STATE_DIR
+
+# --------------------------------------------------
+# Socket
+# --------------------------------------------------
+SOCKET_PATH = os.path.join(STATE_DIR, "scand.sock")
+
+# Unix socket yoksa (Windows) daemon hiç kullanılmaz, her şey yerel taranır
+SUPPORTED = hasattr(socket, "AF_UNIX")
+
+CONNECT_TIMEOUT = 0.2       # daemon yoksa hemen yerel taramaya düşülür
+POLL_INTERVAL = 0.25        # yanıt beklerken cancel kontrol aralığı
+PING_TIMEOUT = 1.0
+PRECOMMIT_TIMEOUT = 10.0    # daemon takılırsa hook yerel taramaya düşer
+PARENT_CHECK_SEC = 2.0      # launcher ölünce daemon da kapanır
+ROW_BATCH = 1000            # bulgular satır başına değil, gruplar halinde gönderilir
+
+# Protokol: istek tek JSON satırı {"op": ...}. Yanıt JSON satırları:
+#   [[kind, title, detail, path, line, rule], ...]  → bulgu grubu (ROW_BATCH'e kadar)
+#   {"status": {...}}                   → progress olayı (istemci ipc'ye aktarır)
+#   {"done": true, ...}                 → son satır
+#   {"error": "..."}                    → hata, istemci yerel taramaya düşer
+
+
+class RemoteFinding(NamedTuple):
+    """
+    scanner.Finding ile aynı alanlar; hook scanner'ı import etmeden
+    bulguları okuyabilsin diye.
+    """
+    kind: str
+    title: str
+    detail: str
+    path: str
+    line: int | None = None
+    rule: str = ""
+
+
+class DaemonUnavailable(Exception):
+    """
+    Daemon çalışmıyor, bağlantı koptu ya da hata döndü.
+    """
+
+
+# --------------------------------------------------
+# Client
+# --------------------------------------------------
+def _connect() -> socket.socket:
+    if not SUPPORTED:
+        raise DaemonUnavailable("unix sockets not supported")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(SOCKET_PATH)
+    except OSError as e:
+        sock.close()
+        raise DaemonUnavailable(str(e)) from None
+    return sock
+
+
+def _request(
+    msg: Dict[str, Any],
+    on_row: Callable[[list], None],
+    on_status: Callable[[Dict[str, Any]], None] | None = None,
+    cancel: threading.Event | None = None,
+    timeout: float | None = None,
+) -> Dict[str, Any] | None:
+    """
+    İsteği gönderir, yanıtı satır satır işler. {"done"} kaydını döner;
+    cancel set edilirse bağlantıyı kapatıp None döner (daemon bir sonraki
+    yazmada taramayı bırakır). timeout: tüm yanıt için süre sınırı,
+    aşılırsa DaemonUnavailable (daemon bağlantıyı kabul edip takıldıysa).
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    sock = _connect()
+    try:
+        try:
+            sock.sendall(json.dumps(msg).encode("utf-8") + b"\n")
+        except OSError as e:
+            raise DaemonUnavailable(str(e)) from None
+        sock.settimeout(POLL_INTERVAL)
+
+        buf = b""
+        while True:
+            if cancel is not None and cancel.is_set():
+                return None
+            if deadline is not None and time.monotonic() > deadline:
+                raise DaemonUnavailable("timed out")
+            try:
+                chunk = sock.recv(1 << 16)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                raise DaemonUnavailable(str(e)) from None
+            if not chunk:
+                raise DaemonUnavailable("connection closed")
+
+            *lines, buf = (buf + chunk).split(b"\n")
+            for line in lines:
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    raise DaemonUnavailable("bad reply") from None
+
+                if isinstance(item, list):
+                    for row in item:
+                        on_row(row)
+                elif "status" in item:
+                    if on_status is not None:
+                        on_status(item["status"])
+                elif "error" in item:
+                    raise DaemonUnavailable(item["error"])
+                elif item.get("done"):
+                    return item
+    finally:
+        sock.close()
+
+
+def ping() -> bool:
+    try:
+        return _request({"op": "ping"}, on_row=lambda row: None, timeout=PING_TIMEOUT) is not None
+    except DaemonUnavailable:
+        return False
+
+
+def remote_scan(
+    root: str,
+    mode: str,
+    only_files: list[str] | None = None,
+    stats=None,
+    cancel: threading.Event | None = None,
+):
+    """
+    scanner.scan_project'in daemon üzerinden çalışan karşılığı: sıralı
+    FindingStore döner, stats'ı doldurur, progress olaylarını bu
+    process'in ipc kanalına aktarır. Daemon yoksa ya da tarama yarıda
+    koparsa DaemonUnavailable; çağıran yerel taramaya düşer.
+    """
+    from ipc import write_status
+    from scanner import FindingStore, ScanCancelled
+
+    findings = FindingStore()
+    done = _request(
+        {
+            "op": "scan",
+            "root": os.path.abspath(os.path.expanduser(root)),
+            "mode": mode,
+            "only_files": [os.path.abspath(p) for p in only_files or ()],
+        },
+        on_row=lambda row: findings.add(*row),
+        on_status=write_status,
+        cancel=cancel,
+    )
+    if done is None:
+        raise ScanCancelled()
+
+    if stats is not None:
+        for name, value in (done.get("stats") or {}).items():
+            if hasattr(stats, name):
+                setattr(stats, name, value)
+
+    findings.sort()
+    return findings
+
+
+def remote_precommit(
+    repo_root: str,
+    hunks: list[tuple[str, list[tuple[int, str]]]],
+    fail_fast: bool = True,
+    git_env: Dict[str, str] | None = None,
+) -> list[RemoteFinding]:
+    """
+    Staged diff satırlarını daemon'daki sıcak scanner'la tarar
+    (precommit_runner.iter_diff_findings ile aynı sonuç). git_env
+    (git_changed.hook_git_env()) daemon'daki git çağrılarına verilir:
+    commit -a'da hook'un geçici index'i okunsun diye.
+    """
+    findings: list[RemoteFinding] = []
+    _request(
+        {
+            "op": "precommit",
+            "root": os.path.abspath(repo_root),
+            "hunks": hunks,
+            "fail_fast": fail_fast,
+            "git_env": git_env or {},
+        },
+        on_row=lambda row: findings.append(RemoteFinding(*row)),
+        timeout=PRECOMMIT_TIMEOUT,
+    )
+    return findings
+
+
+# --------------------------------------------------
+# Server
+# --------------------------------------------------
+class _Handler(socketserver.StreamRequestHandler):
+    wbufsize = 1 << 16
+
+    def setup(self):
+        super().setup()
+        self._rows: list[list] = []
+
+    def send(self, item, flush: bool = False):
+        if self._rows:
+            self._write(self._rows)
+            self._rows = []
+        self._write(item)
+        if flush:
+            self.wfile.flush()
+
+    def send_finding(self, f):
+        self._rows.append([f.kind, f.title, f.detail, f.path, f.line, f.rule])
+        if len(self._rows) >= ROW_BATCH:
+            self._write(self._rows)
+            self._rows = []
+
+    def _write(self, item):
+        self.wfile.write(
+            json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            + b"\n"
+        )
+
+    def finish(self):
+        try:
+            super().finish()
+        except OSError:
+            pass                # yanıt yarıda bırakıldı
+
+    def handle(self):
+        daemon: ScanDaemon = self.server.scan_daemon
+        try:
+            req = json.loads(self.rfile.readline())
+            op = daemon.ops.get(req.get("op"))
+            if op is None:
+                self.send({"error": f"unknown op: {req.get('op')}"}, flush=True)
+                return
+            op(req, self)
+        except OSError:
+            pass                # istemci bağlantıyı kapattı (cancel, fail-fast)
+        except Exception as e:
+            try:
+                self.send({"error": repr(e)}, flush=True)
+            except OSError:
+                pass
+
+
+if SUPPORTED:
+    class _Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+class ScanDaemon:
+    """
+    Uzun ömürlü tarama process'i (launcher başlatır, config: scan_daemon).
+
+    Scanner modülleri bir kez import edilir; her proje + mode için
+    ScanCache (path → size/mtime/bulgular dosya index'i) bellekte kalır,
+    tekrar taramalarda diskten okunup parse edilmez. Ağaç yine her
+    taramada stat'lanır: değişen dosyalar bu sayede yakalanır.
+
+    Aynı proje + mode'a gelen taramalar sıraya girer; precommit istekleri
+    cache'e dokunmadığı için beklemez.
+    """
+
+    def __init__(self):
+        self.caches: dict = {}
+        self._locks: Dict[tuple, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.server: _Server | None = None
+
+        self.ops: Dict[str, Callable[[Dict[str, Any], _Handler], None]] = {
+            "ping": self.op_ping,
+            "scan": self.op_scan,
+            "precommit": self.op_precommit,
+        }
+
+    def _lock_for(self, key: tuple) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    # --------------------------------------------------
+    # Ops
+    # --------------------------------------------------
+    def op_ping(self, req, out: _Handler):
+        out.send({"done": True, "pid": os.getpid()}, flush=True)
+
+    def op_scan(self, req, out: _Handler):
+        from dataclasses import asdict
+
+        from scanner import ScanStats, iter_findings
+
+        root, mode = req["root"], req["mode"]
+        stats = ScanStats()
+
+        with self._lock_for((root, mode)):
+            findings = iter_findings(
+                root,
+                mode,
+                only_files=req.get("only_files") or None,
+                stats=stats,
+                config=config_snapshot(),
+                caches=self.caches,
+                on_progress=lambda st: out.send({"status": st}, flush=True),
+            )
+            try:
+                for f in findings:
+                    out.send_finding(f)
+            finally:
+                findings.close()    # istemci koptuysa taranan kısım cache'e yazılır
+
+        out.send({"done": True, "stats": asdict(stats)}, flush=True)
+
+    def op_precommit(self, req, out: _Handler):
+        from precommit_runner import iter_diff_findings
+
+        hunks = [
+            (path, [(lineno, text) for lineno, text in lines])
+            for path, lines in req["hunks"]
+        ]
+        fail_fast = req.get("fail_fast", True)
+
+        findings = iter_diff_findings(
+            Path(req["root"]),
+            config_snapshot(),
+            hunks,
+            git_env=req.get("git_env") or None,
+        )
+        try:
+            for f in findings:
+                out.send_finding(f)
+                if fail_fast and f.kind == "RISK":
+                    break
+        finally:
+            findings.close()
+
+        out.send({"done": True}, flush=True)
+
+    # --------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------
+    def serve_forever(self, parent_pid: int | None = None):
+        if not SUPPORTED:
+            return
+        os.makedirs(STATE_DIR, exist_ok=True)
+        if ping():
+            return              # başka bir daemon zaten çalışıyor
+
+        try:
+            os.unlink(SOCKET_PATH)    # önceki çalışmadan kalan socket
+        except FileNotFoundError:
+            pass
+
+        # İlk istek de sıcak gelsin
+        import precommit_runner  # noqa: F401
+        import scanner  # noqa: F401
+
+        self.server = _Server(SOCKET_PATH, _Handler)
+        self.server.scan_daemon = self
+        os.chmod(SOCKET_PATH, 0o600)     # bulgular secret içerebilir
+
+        if parent_pid is not None:
+            threading.Thread(
+                target=self._watch_parent,
+                args=(parent_pid,),
+                name="zinkx-scand-parent",
+                daemon=True,
+            ).start()
+
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            try:
+                os.unlink(SOCKET_PATH)
+            except OSError:
+                pass
+
+    def shutdown(self):
+        if self.server is not None:
+            # serve_forever'ın çalıştığı thread'den çağrılmamalı
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    def _watch_parent(self, parent_pid: int):
+        stop = threading.Event()
+        while not stop.wait(PARENT_CHECK_SEC):
+            if os.getppid() != parent_pid:
+                self.shutdown()
+                return
+
+
+def _exit_on_sigterm(signum, frame):
+    # terminate() → finally'ler çalışsın, socket silinsin
+    raise SystemExit(0)
+
+
+def run_daemon():
+    """
+    launcher.py'nin başlattığı process'in hedefi.
+    """
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    ScanDaemon().serve_forever(parent_pid=os.getppid())
+
+
+if __name__ == "__main__":
+    run_daemon()
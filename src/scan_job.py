@@ -0,0 +1,116 @@
+import threading
+import time
+from typing import Callable
+
+from config import config_snapshot
+from export import write_exports
+from report_catalog import record_report
+from report_html import write_html_report
+from scan_daemon import DaemonUnavailable, remote_scan
+from scanner import ScanCancelled, ScanStats, scan_project
+
+
+class ScanJob:
+    """
+    Tek bir tarama + HTML rapor, arka plan thread'inde.
+
+    Menü bar main thread'i tarama boyunca bloklanmaz. cancel() tarama
+    döngüsünü bir sonraki dosyada durdurur. Bittiğinde (başarılı, iptal
+    ya da hata) on_done(job) worker thread'inden çağrılır; UI'a dokunacak
+    callback kendi main thread'ine aktarmalı.
+
+    scan_daemon açıksa tarama sıcak daemon'a yaptırılır; daemon yoksa ya
+    da yarıda koparsa aynı tarama burada yapılır.
+    """
+
+    def __init__(
+        self,
+        project: str,
+        mode: str,
+        on_done: Callable[["ScanJob"], None],
+        out_dir: str = "reports",
+    ):
+        self.project = project
+        self.mode = mode
+        self.on_done = on_done
+        self.out_dir = out_dir
+
+        self.cancel_event = threading.Event()
+        self.stats = ScanStats()
+        self.counts: dict[str, int] = {}
+        self.report_path: str | None = None
+        self.export_paths: list[str] = []
+        self.duration_sec: float | None = None
+        self.cancelled = False
+        self.error: Exception | None = None
+
+        self._thread = threading.Thread(
+            target=self._run, name="zinkx-scan", daemon=True
+        )
+
+    def start(self) -> "ScanJob":
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def join(self, timeout: float | None = None):
+        self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            cfg = config_snapshot()
+            t0 = time.monotonic()
+            findings = self._scan(cfg)
+            self.duration_sec = time.monotonic() - t0
+            self.counts = findings.count_by_kind()
+            report = write_html_report(
+                findings,
+                self.project,
+                out_dir=self.out_dir,
+                config=cfg,
+            )
+            self.report_path = str(report)
+            self.export_paths = [
+                str(p) for p in write_exports(
+                    findings, report, self.project, self.mode, config=cfg
+                )
+            ]
+            record_report(
+                report,
+                self.project,
+                self.mode,
+                self.counts,
+                duration_sec=self.duration_sec,
+                exports=self.export_paths,
+            )
+        except ScanCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+        finally:
+            self.on_done(self)
+
+    def _scan(self, cfg):
+        if cfg.get("scan_daemon", True):
+            try:
+                return remote_scan(
+                    self.project,
+                    self.mode,
+                    stats=self.stats,
+                    cancel=self.cancel_event,
+                )
+            except DaemonUnavailable:
+                pass
+
+        return scan_project(
+            self.project,
+            mode=self.mode,
+            stats=self.stats,
+            config=cfg,
+            cancel=self.cancel_event,
+        )
@@ -1,12 +1,34 @@
 from __future__ import annotations
 
+import codecs
+import os
 import re
-from dataclasses import dataclass
+import stat
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, NamedTuple
 
-from config import load_config
-from ipc import write_status   # 👈 progress IPC
+from config import ConfigSnapshot, config_snapshot
+from rules import (  # noqa: F401  (SECRET_PATTERNS / EMAIL_PATTERN re-export)
+    CASEFOLD_ODD,
+    EMAIL_PATTERN,
+    SECRET_PATTERNS,
+    RuleEngine,
+    build_engine,
+)
+
+if TYPE_CHECKING:
+    from scan_cache import ScanCache
+
+# Not: ipc, scan_cache ve concurrent.futures kullanıldıkları yerde import
+# edilir; scan_lines/scan_bytes kullanan pre-commit hook'u bunları yüklemez.
 
 
 # --------------------------------------------------
@@ -30,31 +52,232 @@ IGNORE_DIRS = {
     ".idea", ".vscode", "__pycache__", ".pytest_cache",
 }
 
-# --------------------------------------------------
-# Security patterns
-# --------------------------------------------------
-SECRET_PATTERNS = [
-    re.compile(r"(api[_-]?key|secret|token|password)\s*=\s*['\"][^'\"]+['\"]", re.I),
-    re.compile(r"(api[_-]?key|secret|token|password)\s*:\s*['\"][^'\"]+['\"]", re.I),
-]
+# Bu marker'ı içeren dosyalar hiç taranmaz
+IGNORE_FILE_MARKER = "@zinkx-ignore-security"
 
-EMAIL_PATTERN = re.compile(
-    r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
-)
+# Kural dışı bulguların id'leri (rules.Rule.id ile aynı isim alanı)
+RULE_LARGE_FILE = "large_file"
+RULE_ENV_GITIGNORE = "env.gitignore"
 
-IGNORE_FILE_MARKER = "@zinkx-ignore-security"
+# Bu boyuta kadar dosya tek seferde okunur, üstü parça parça taranır
+IN_MEMORY_LIMIT = 400_000
+CHUNK_BYTES = 1 << 20
+
+# Dosya sınıfı, baştaki bu kadar byte'a bakılarak belirlenir
+SNIFF_BYTES = 8192
+# Minified dosyalarda kurallar anchor çevresinde en fazla bu kadar karakter görür
+MAX_LINE_CHARS = 4096
+
+# Sniff sonucu dosya sınıfları
+FILE_TEXT = "text"
+FILE_BINARY = "binary"          # NUL byte → hiç taranmaz
+FILE_UTF16 = "utf16"            # BOM / NUL deseni → utf-16 olarak decode
+FILE_MINIFIED = "minified"      # dev satırlar → satır uzunluğu sınırlanır
 
 
 # --------------------------------------------------
 # Models
 # --------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class Finding:
     kind: str            # RISK | TODO | INFO
     title: str
     detail: str
     path: str
     line: int | None = None
+    rule: str = ""       # kural id'si (rules.Rule.id), başlık değişse de sabit
+
+
+FINDING_PRIORITY = {"RISK": 0, "TODO": 1, "INFO": 2}
+
+
+def finding_sort_key(f: Finding):
+    return (FINDING_PRIORITY.get(f.kind, 9), f.path, f.line or 0)
+
+
+class FindingStore(Sequence):
+    """
+    Kolon bazlı, hafıza dostu bulgu deposu.
+
+    path / kind / title / rule tekil tablolarda (interned) tutulur, her bulgu
+    bunlara array index'i ile referans verir. Okurken Finding view'ı
+    üretilir; bu yüzden list[Finding] bekleyen kod (report.write_report,
+    report_html, app) değişmeden çalışır.
+    """
+
+    __slots__ = (
+        "_paths", "_path_ids", "_kinds", "_kind_ids", "_titles", "_title_ids",
+        "_rules", "_rule_ids",
+        "_path_col", "_kind_col", "_title_col", "_line_col", "_rule_col", "_details",
+    )
+
+    def __init__(self, findings: Iterable[Finding] = ()):
+        self._paths: list[str] = []
+        self._path_ids: dict[str, int] = {}
+        self._kinds: list[str] = []
+        self._kind_ids: dict[str, int] = {}
+        self._titles: list[str] = []
+        self._title_ids: dict[str, int] = {}
+        self._rules: list[str] = []
+        self._rule_ids: dict[str, int] = {}
+
+        self._path_col = array("I")
+        self._kind_col = array("H")
+        self._title_col = array("H")
+        self._line_col = array("I")      # 0 = satır yok
+        self._rule_col = array("H")
+        self._details: list[str] = []
+
+        self.extend(findings)
+
+    @staticmethod
+    def _intern(value: str, table: list[str], ids: dict[str, int]) -> int:
+        idx = ids.get(value)
+        if idx is None:
+            idx = len(table)
+            table.append(sys.intern(value))
+            ids[value] = idx
+        return idx
+
+    # --------------------------------------------------
+    # Write
+    # --------------------------------------------------
+    def add(
+        self,
+        kind: str,
+        title: str,
+        detail: str,
+        path: str,
+        line: int | None = None,
+        rule: str = "",
+    ):
+        self._kind_col.append(self._intern(kind, self._kinds, self._kind_ids))
+        self._title_col.append(self._intern(title, self._titles, self._title_ids))
+        self._path_col.append(self._intern(path, self._paths, self._path_ids))
+        self._line_col.append(line or 0)
+        self._rule_col.append(self._intern(rule, self._rules, self._rule_ids))
+        self._details.append(detail)
+
+    def append(self, f: Finding):
+        self.add(f.kind, f.title, f.detail, f.path, f.line, f.rule)
+
+    def extend(self, findings: Iterable[Finding]):
+        for f in findings:
+            self.add(f.kind, f.title, f.detail, f.path, f.line, f.rule)
+
+    def sort(self):
+        """
+        RISK → TODO → INFO, path, line (finding_sort_key ile aynı, stable).
+        """
+        path_rank = {
+            idx: rank
+            for rank, idx in enumerate(
+                sorted(range(len(self._paths)), key=self._paths.__getitem__)
+            )
+        }
+        kind_prio = [FINDING_PRIORITY.get(k, 9) for k in self._kinds]
+
+        kind_col, path_col, line_col = self._kind_col, self._path_col, self._line_col
+        order = sorted(
+            range(len(self._details)),
+            key=lambda i: (kind_prio[kind_col[i]], path_rank[path_col[i]], line_col[i]),
+        )
+
+        self._kind_col = array("H", (kind_col[i] for i in order))
+        self._title_col = array("H", (self._title_col[i] for i in order))
+        self._path_col = array("I", (path_col[i] for i in order))
+        self._line_col = array("I", (line_col[i] for i in order))
+        self._rule_col = array("H", (self._rule_col[i] for i in order))
+        self._details = [self._details[i] for i in order]
+
+    # --------------------------------------------------
+    # Read (Sequence[Finding])
+    # --------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._details)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        line = self._line_col[i]
+        return Finding(
+            self._kinds[self._kind_col[i]],
+            self._titles[self._title_col[i]],
+            self._details[i],
+            self._paths[self._path_col[i]],
+            line=line or None,
+            rule=self._rules[self._rule_col[i]],
+        )
+
+    def __iter__(self) -> Iterator[Finding]:
+        kinds, titles, paths, rules = self._kinds, self._titles, self._paths, self._rules
+        for k, t, p, line, r, detail in zip(
+            self._kind_col, self._title_col, self._path_col,
+            self._line_col, self._rule_col, self._details,
+        ):
+            yield Finding(kinds[k], titles[t], detail, paths[p], line=line or None, rule=rules[r])
+
+    def is_sorted(self) -> bool:
+        """
+        sort() sırasında mı (Finding üretmeden, kolonlar üzerinden).
+        """
+        kind_prio = [FINDING_PRIORITY.get(k, 9) for k in self._kinds]
+        paths = self._paths
+        prev = None
+        for k, p, line in zip(self._kind_col, self._path_col, self._line_col):
+            key = (kind_prio[k], paths[p], line)
+            if prev is not None and key < prev:
+                return False
+            prev = key
+        return True
+
+    def count_by_kind(self) -> dict[str, int]:
+        counts = dict.fromkeys(self._kinds, 0)
+        for k in self._kind_col:
+            counts[self._kinds[k]] += 1
+        return counts
+
+
+def count_by_kind(findings: Iterable[Finding]) -> dict[str, int]:
+    """
+    kind → bulgu sayısı. FindingStore ise kind kolonu üzerinden sayar;
+    diğer iterable'lar (generator dahil) bir kez tüketilir.
+    """
+    if isinstance(findings, FindingStore):
+        return findings.count_by_kind()
+    counts: dict[str, int] = {}
+    for f in findings:
+        counts[f.kind] = counts.get(f.kind, 0) + 1
+    return counts
+
+
+class FileEntry(NamedTuple):
+    path: str
+    size: int
+    mtime_ns: int = 0
+
+
+class FileResult(NamedTuple):
+    findings: list[Finding]
+    prefiltered: bool = False     # prefilter dosyayı satır taramasına sokmadı
+    file_class: str = FILE_TEXT   # sniff sonucu (FILE_*)
+
+
+class ScanCancelled(Exception):
+    """
+    iter_findings/scan_project'e verilen cancel event'i set edildi.
+    """
+
+
+@dataclass
+class ScanStats:
+    files_total: int = 0          # taranmaya aday TEXT_EXTS dosyaları
+    files_cached: int = 0         # scan cache'ten gelenler
+    files_scanned: int = 0        # okunup taranan dosyalar
+    prefilter_rejected: int = 0   # anchor içermediği için satır taraması atlananlar
+    binary_skipped: int = 0       # NUL byte içerdiği için atlananlar
+    utf16_decoded: int = 0        # utf-16 olarak decode edilenler
+    minified_capped: int = 0      # satır uzunluğu sınırlanarak taranan minified dosyalar
 
 
 # --------------------------------------------------
@@ -66,199 +289,905 @@ def _is_ignored_dir(p: Path, cfg) -> bool:
     return any(part in IGNORE_DIRS for part in p.parts)
 
 
-def _safe_read_text(path: Path, limit_bytes: int = 400_000) -> str:
+def _safe_read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except Exception:
+        return b""
+
+
+def _sniff(head: bytes, size: int, max_line: int) -> tuple[str, str]:
+    """
+    Dosyanın ilk SNIFF_BYTES'ına bakıp (file_class, encoding) döner.
+    Uzantıya güvenilmez: yanlış adlandırılmış binary'ler, utf-16 dosyalar
+    ve minified bundle'lar burada ayrılır.
+    """
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return FILE_UTF16, "utf-16"
+
+    if b"\x00" in head:
+        # BOM'suz utf-16: ASCII ağırlıklı metinde her ikinci byte NUL
+        even, odd = head[0::2], head[1::2]
+        if odd and odd.count(0) >= len(odd) * 0.9 and even.count(0) == 0:
+            return FILE_UTF16, "utf-16-le"
+        if even and even.count(0) >= len(even) * 0.9 and odd.count(0) == 0:
+            return FILE_UTF16, "utf-16-be"
+        return FILE_BINARY, ""
+
+    if max_line and size > max_line:
+        if any(len(line) > max_line for line in head.splitlines()):
+            return FILE_MINIFIED, "utf-8"
+
+    return FILE_TEXT, "utf-8"
+
+
+def _safe_read_text(
+    path: Path,
+    limit_bytes: int = IN_MEMORY_LIMIT,
+    size: int | None = None,
+) -> str:
     try:
-        if path.stat().st_size > limit_bytes:
+        if size is None:
+            size = path.stat().st_size
+        if size > limit_bytes:
             return ""
         return path.read_text(encoding="utf-8", errors="ignore")
     except Exception:
         return ""
 
 
-def _emit_progress(percent: int, mode: str):
+def _count_line_breaks(text: str) -> int:
+    """
+    str.splitlines() ile aynı sayım (CRLF tek satır sonu).
+    """
+    n = text.count("\n") + text.count("\r") - text.count("\r\n")
+    for c in _EXOTIC_BREAKS:
+        n += text.count(c)
+    return n
+
+
+def _iter_text_chunks(
+    path: str,
+    chunk_bytes: int,
+    encoding: str = "utf-8",
+    hard_cut: bool = False,
+) -> Iterator[str]:
+    """
+    Büyük dosyaları sabit bellekle, satır sınırına hizalı parçalar halinde
+    okur. Son parça hariç her parça bir satır sonuyla biter ve CRLF asla
+    ikiye bölünmez; böylece satır bazlı kurallar parça sınırında kaçmaz.
+    Satır sonu hiç olmayan dev satırlar tek parça halinde birikir;
+    hard_cut=True (minified) ise satır ortasından da bölünür.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+    carry = ""
+
+    with open(path, "rb") as f:
+        while True:
+            raw = f.read(chunk_bytes)
+            buf = carry + decoder.decode(raw, final=not raw)
+            if not raw:
+                if buf:
+                    yield buf
+                return
+
+            # Sondaki \r, bir sonraki parçadaki \n ile CRLF olabilir
+            limit = len(buf) - 1 if buf.endswith("\r") else len(buf)
+            cut = max(buf.rfind(c, 0, limit) for c in _BREAK_CHARS)
+            if cut < 0:
+                if not (hard_cut and limit):
+                    carry = buf
+                    continue
+                cut = limit - 1
+
+            yield buf[:cut + 1]
+            carry = buf[cut + 1:]
+
+
+def _walk_files(root: Path, cfg) -> Iterator[FileEntry]:
+    """
+    os.scandir tabanlı, budayan dizin gezgini.
+    IGNORE_DIRS / node_modules içine hiç girmez; sadece TEXT_EXTS
+    dosyalarını, DirEntry'den gelen boyutla birlikte lazy olarak verir.
+    """
+    skip = set(IGNORE_DIRS)
+    if cfg.get("ignore_node_modules", True):
+        skip.add("node_modules")
+
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip:
+                            stack.append(entry.path)
+                        continue
+
+                    if os.path.splitext(entry.name)[1].lower() not in TEXT_EXTS:
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    st = entry.stat()
+                    yield FileEntry(entry.path, st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+
+
+def is_scan_candidate(path: str, cfg) -> bool:
+    """
+    Tam taramada da gezilecek bir dosya mı (uzantı + ignore dizinleri).
+    path proje köküne göre olmalı: kökün üstündeki dizinler (ör. repo
+    ~/build/app altında) ignore sayılmasın.
+    """
+    p = Path(path)
+    return p.suffix.lower() in TEXT_EXTS and not _is_ignored_dir(p, cfg)
+
+
+def _iter_only_files(only_files: list[str], root: Path, cfg) -> Iterator[FileEntry]:
+    for f in only_files:
+        p = Path(f)
+        if not is_scan_candidate(os.path.relpath(f, root), cfg):
+            continue
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        yield FileEntry(str(p), st.st_size, st.st_mtime_ns)
+
+
+def _open_cache(
+    rootp: Path,
+    mode: str,
+    ignore_markers,
+    engine: RuleEngine,
+    max_line: int,
+    cfg,
+    caches: dict | None = None,
+) -> ScanCache | None:
+    """
+    caches: (root, mode) → ScanCache; verilirse cache process ömrü boyunca
+    bellekte tutulur (scan_daemon), her taramada diskten tekrar okunmaz.
+    """
+    if not cfg.get("scan_cache", True):
+        return None
+
+    from scan_cache import ScanCache, make_cache_key
+
+    key = make_cache_key(
+        f"{engine.fingerprint}|{IGNORE_FILE_MARKER}|{max_line}",
+        ignore_markers,
+        mode,
+    )
+    verify_hash = cfg.get("scan_cache_hash", False)
+
+    if caches is not None:
+        warm = caches.get((str(rootp), mode))
+        if warm is not None and warm.key == key:
+            warm.verify_hash = verify_hash
+            return warm.begin()
+
+    cache = ScanCache(str(rootp), mode, key, verify_hash=verify_hash).load()
+    if caches is not None:
+        caches[(str(rootp), mode)] = cache
+    return cache
+
+
+class ProgressReporter:
+    """
+    Zaman bazlı, rate-limit'li progress IPC.
+
+    Toplamlar taramadan önce aday listesinden (dosya sayısı + DirEntry
+    boyutları) gelir. Olay en fazla `interval` saniyede bir yazılır; her
+    dosyada sadece bir monotonic() okuması yapılır, tarama yavaşlamaz.
+    Throughput ve ETA sadece gerçekten taranan (cache dışı) byte'lardan
+    hesaplanır.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        root: Path,
+        files_total: int,
+        bytes_total: int,
+        counts: dict,
+        interval: float = 0.25,
+        enabled: bool = True,
+        sink: Callable[[dict], None] | None = None,
+    ):
+        self.mode = mode
+        self.root = str(root)
+        self.files_total = files_total
+        self.bytes_total = bytes_total
+        self.counts = counts
+        self.interval = interval
+        self.enabled = enabled
+        self.sink = sink
+
+        self.files_done = 0
+        self.bytes_done = 0
+        self.bytes_scanned = 0
+        self.current_dir = ""
+
+        self._t0 = time.monotonic()
+        self._next_emit = self._t0 + interval
+
+    def advance(self, entry: FileEntry, scanned: bool = True):
+        self.files_done += 1
+        self.bytes_done += entry.size
+        if scanned:
+            self.bytes_scanned += entry.size
+
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        if now >= self._next_emit:
+            self._next_emit = now + self.interval
+            self.current_dir = os.path.dirname(entry.path)
+            self._emit(now)
+
+    def finish(self, stats: ScanStats | None = None):
+        if self.enabled:
+            self._emit(time.monotonic(), stats, final=True)
+
+    def _emit(self, now: float, stats: ScanStats | None = None, final: bool = False):
+        elapsed = max(now - self._t0, 1e-6)
+        bytes_per_sec = self.bytes_scanned / elapsed
+        remaining = self.bytes_total - self.bytes_done
+
+        if final:
+            percent, eta = 100, 0.0
+        else:
+            percent = int(self.files_done * 100 / (self.files_total or 1))
+            eta = remaining / bytes_per_sec if bytes_per_sec > 0 else None
+
+        try:
+            current_dir = os.path.relpath(self.current_dir, self.root) if self.current_dir else ""
+        except ValueError:
+            current_dir = self.current_dir
+
+        status = {
+            "type": "progress",
+            "percent": min(percent, 100),
+            "mode": self.mode,
+            "counts": dict(self.counts),
+            "files_done": self.files_done,
+            "files_total": self.files_total,
+            "bytes_done": self.bytes_done,
+            "bytes_total": self.bytes_total,
+            "files_per_sec": round(self.files_done / elapsed, 1),
+            "bytes_per_sec": int(bytes_per_sec),
+            "eta_sec": None if eta is None else round(eta, 1),
+            "current_dir": current_dir,
+            "elapsed_sec": round(elapsed, 2),
+        }
+        if stats is not None:
+            status["stats"] = asdict(stats)
+
+        if self.sink is not None:
+            self.sink(status)
+            return
+
+        from ipc import write_status   # 👈 progress IPC
+        write_status(status)
+
+
+# --------------------------------------------------
+# Single-pass rule engine
+# --------------------------------------------------
+# Dosya metni bir kez lower() edilip, uzantının RuleGroup'undaki tüm
+# anchor'ların birleşik regex'i ile aranır; sadece anchor geçen satırlar
+# kural kontrolüne girer (bkz. rules.py).
+
+# str.splitlines() ile aynı satır sonları
+_EXOTIC_BREAKS = "\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_BREAK_CHARS = "\n\r" + _EXOTIC_BREAKS
+_LINE_BREAK_RE = re.compile(f"\r\n|[{_BREAK_CHARS}]")
+_EXOTIC_BREAK_RE = re.compile(f"[{_EXOTIC_BREAKS}]")
+
+
+class _LineMap:
+    """
+    Match offset → (satır no, satır başı, satır sonu).
+    Numaralama text.splitlines() ile birebir aynıdır. Sadece LF / CRLF
+    içeren metinlerde (yaygın durum) satır index'i hiç kurulmaz.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._starts: list[int] | None = None
+        self._ends: list[int] | None = None
+        self._last_pos = 0
+        self._last_line = 1
+
+        simple = (
+            _EXOTIC_BREAK_RE.search(text) is None
+            and text.count("\r") == text.count("\r\n")
+        )
+        if not simple:
+            self._starts = [0]
+            self._ends = []
+            for m in _LINE_BREAK_RE.finditer(text):
+                self._ends.append(m.start())
+                self._starts.append(m.end())
+            self._ends.append(len(text))
+
+    def bounds(self, pos: int) -> tuple[int, int, int]:
+        """
+        (line_no, start, end) — pos'lar artan sırada gelmeli.
+        """
+        text = self.text
+
+        if self._starts is not None:
+            i = bisect_right(self._starts, pos) - 1
+            return i + 1, self._starts[i], self._ends[i]
+
+        self._last_line += text.count("\n", self._last_pos, pos)
+        self._last_pos = pos
+
+        start = text.rfind("\n", 0, pos) + 1
+        end = text.find("\n", pos)
+        if end == -1:
+            end = len(text)
+        elif end > start and text[end - 1] == "\r":
+            end -= 1
+        return self._last_line, start, end
+
+
+def _scan_text(
+    text: str,
+    path: str,
+    mode: str,
+    ignore_markers: tuple[str, ...],
+    engine: RuleEngine,
+    line_offset: int = 0,
+    max_line: int = 0,
+) -> list[Finding] | None:
+    """
+    Dosya metnini tek geçişte tarar. Anchor geçen her satırda,
+    sadece anchor'ı o satırda bulunan kurallar değerlendirilir.
+    line_offset: parça parça taramada, bu parçadan önceki satır sayısı.
+    max_line: > 0 ise (minified) bundan uzun satırlarda kurallar sadece
+    anchor çevresindeki max_line karakterlik pencereyi görür; her kural
+    bir satırda en fazla bir kez raporlanır.
+
+    Prefilter: metinde hiçbir kuralın anchor'ı yoksa satırlara hiç
+    inilmeden None döner (stats'ta prefilter_rejected olarak sayılır).
+    """
+    ext = os.path.splitext(path)[1].lower()
+    group = engine.group_for(ext)
+    if group is None:
+        return None
+
+    low_text = text.lower()
+    folded = len(low_text) == len(text) and not any(
+        c in low_text for c in CASEFOLD_ODD
+    )
+    if not folded:
+        low_text = text
+
+    search = group.search[folded]
+    m = search.search(low_text)
+    if m is None:
+        return None
+
+    name_low = os.path.basename(path).lower()
+    active = [
+        (rule, anchor)
+        for rule, anchor in zip(group.rules, group.rule_anchors[folded])
+        if rule.applies_to(ext, name_low)
+    ]
+
+    findings: list[Finding] = []
+    linemap = _LineMap(text)
+    reported: set[tuple[int, str]] = set()   # uzun satırlarda (satır, kural)
+
+    while m is not None:
+        pos = m.start()
+        lineno, start, end = linemap.bounds(pos)
+        resume = end + 1
+        capped = max_line and end - start > max_line
+
+        if capped:
+            # Satırın tamamı yerine anchor çevresindeki pencere
+            start = max(start, pos - max_line // 2)
+            if start + max_line < end:
+                end = start + max_line
+                resume = end
+
+        line = text[start:end]
+        low = low_text[start:end] if folded else line.lower()
+
+        if not any(mk in low for mk in ignore_markers):
+            hay = low_text[start:end]
+            if capped:
+                detail = text[max(start, pos - 80):min(end, pos + 160)].strip()
+            else:
+                detail = line.strip()[:240]
+
+            for rule, anchor in active:
+                if anchor.search(hay) and rule.matches(line, low):
+                    if capped:
+                        if (lineno, rule.id) in reported:
+                            continue
+                        reported.add((lineno, rule.id))
+                    findings.append(Finding(
+                        rule.severity_for(mode),
+                        rule.title,
+                        detail,
+                        path,
+                        line=line_offset + lineno,
+                        rule=rule.id,
+                    ))
+
+        # Satırın (ya da pencerenin) geri kalanı işlendi → sonrasından devam
+        m = search.search(low_text, resume)
+
+    return findings
+
+
+# --------------------------------------------------
+# Per-file scan (worker)
+# --------------------------------------------------
+def _scan_large_file(
+    path: str,
+    mode: str,
+    ignore_markers: tuple[str, ...],
+    engine: RuleEngine,
+    chunk_bytes: int,
+    encoding: str = "utf-8",
+    max_line: int = 0,
+) -> tuple[bool, list[Finding] | None]:
+    """
+    IN_MEMORY_LIMIT üstü dosyalar: satır hizalı parçalar, tam satır numarası.
+    Dönüş: (skip, findings). skip → boş/okunamayan ya da ignore marker'lı
+    dosya. findings, _scan_text gibi hiçbir parçada anchor yoksa None.
+    max_line verilirse (minified) dev satırlar parça sınırında da bölünür.
+    """
+    findings: list[Finding] | None = None
+    line_offset = 0
+    empty = True
+    reported: set[tuple[int | None, str]] = set()     # (satır, rule id), _scan_text gibi
+
+    try:
+        for chunk in _iter_text_chunks(
+            path, chunk_bytes, encoding, hard_cut=bool(max_line)
+        ):
+            empty = False
+            if IGNORE_FILE_MARKER in chunk:
+                return True, None
+
+            found = _scan_text(
+                chunk, path, mode, ignore_markers, engine, line_offset, max_line
+            )
+            if found is not None:
+                if findings is None:
+                    findings = []
+                if max_line:
+                    # Bölünen satır iki parçada aynı kuralı tekrar bulabilir
+                    found = [
+                        f for f in found
+                        if (f.line, f.rule) not in reported
+                        and not reported.add((f.line, f.rule))
+                    ]
+                findings.extend(found)
+
+            line_offset += _count_line_breaks(chunk)
+    except OSError:
+        return True, None
+
+    return empty, findings
+
+
+def _file_result(
+    findings: list[Finding] | None,
+    path: str,
+    size: int,
+    file_class: str,
+) -> FileResult:
+    prefiltered = findings is None
+    if findings is None:
+        findings = []
+
+    # ----------------------------------------------
+    # Large file warning
+    # ----------------------------------------------
+    if size > 700_000:
+        findings.append(Finding(
+            "INFO",
+            "Large file",
+            f"File is {size / 1024:.0f} KB",
+            path,
+            rule=RULE_LARGE_FILE,
+        ))
+
+    return FileResult(findings, prefiltered, file_class)
+
+
+def _scan_data(
+    data: bytes,
+    path: str,
+    mode: str,
+    ignore_markers: tuple[str, ...],
+    engine: RuleEngine,
+    max_line: int,
+) -> FileResult:
+    """
+    Bellekteki dosya içeriği: sniff → decode → tek geçiş tarama.
+    """
+    size = len(data)
+    file_class, encoding = _sniff(data[:SNIFF_BYTES], size, max_line)
+    if file_class == FILE_BINARY:
+        return FileResult([], file_class=file_class)
+
+    text = data.decode(encoding, errors="ignore")
+    if not text or IGNORE_FILE_MARKER in text:
+        return FileResult([], file_class=file_class)
+
+    cap = max_line if file_class == FILE_MINIFIED else 0
+    findings = _scan_text(text, path, mode, ignore_markers, engine, max_line=cap)
+    return _file_result(findings, path, size, file_class)
+
+
+def _scan_file(
+    entry: FileEntry,
+    mode: str,
+    ignore_markers: tuple[str, ...],
+    engine: RuleEngine,
+    in_memory_limit: int = IN_MEMORY_LIMIT,
+    chunk_bytes: int = CHUNK_BYTES,
+    max_line: int = MAX_LINE_CHARS,
+) -> FileResult:
     """
-    UI için progress IPC
+    Tek dosyayı tarar. Worker process/thread içinde çalışır,
+    bu yüzden config okumaz ve IPC'ye dokunmaz.
+    Önce dosyanın başı sniff edilir: binary atlanır, utf-16 doğru
+    decode edilir, minified dosyalarda satır uzunluğu sınırlanır.
     """
-    write_status({
-        "type": "progress",
-        "percent": percent,
-        "mode": mode,
-    })
+    path, size = entry.path, entry.size
+
+    if size <= in_memory_limit:
+        data = _safe_read_bytes(Path(path))
+        return _scan_data(data, path, mode, ignore_markers, engine, max_line)
+
+    try:
+        with open(path, "rb") as f:
+            head = f.read(SNIFF_BYTES)
+    except OSError:
+        return FileResult([])
+
+    file_class, encoding = _sniff(head, size, max_line)
+    if file_class == FILE_BINARY:
+        return FileResult([], file_class=file_class)
+
+    cap = max_line if file_class == FILE_MINIFIED else 0
+    skip, findings = _scan_large_file(
+        path, mode, ignore_markers, engine, chunk_bytes, encoding, cap
+    )
+    if skip:
+        return FileResult([], file_class=file_class)
+
+    return _file_result(findings, path, size, file_class)
+
+
+# --------------------------------------------------
+# Worker pool
+# --------------------------------------------------
+def _resolve_workers(cfg) -> int:
+    workers = int(cfg.get("scan_workers", 0) or 0)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def _map_files(scan_file, entries: list[FileEntry], cfg) -> Iterable[FileResult]:
+    """
+    Dosyaları paralel tarar; sonuçlar `entries` sırasıyla döner.
+    Böylece merge + stable sort, seri taramayla birebir aynı listeyi verir.
+    """
+    workers = _resolve_workers(cfg)
+    min_files = int(cfg.get("scan_parallel_min_files", 200))
+
+    if workers <= 1 or len(entries) < min_files:
+        yield from map(scan_file, entries)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if cfg.get("scan_executor", "process") == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+        results = pool.map(scan_file, entries)
+    else:
+        chunksize = max(1, min(64, len(entries) // (workers * 8)))
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(scan_file, entries, chunksize=chunksize)
+
+    # Consumer erken bırakırsa (generator close) kuyruktaki işler iptal edilir
+    try:
+        yield from results
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# --------------------------------------------------
+# Project checks
+# --------------------------------------------------
+def check_env_gitignore(rootp: Path, cfg) -> Finding | None:
+    """
+    Projede .env var ama .gitignore'da geçmiyorsa RISK.
+    """
+    if not cfg.get("ignore_env", True):
+        return None
+
+    env_file = rootp / ".env"
+    if not env_file.exists():
+        return None
+
+    gitignore = rootp / ".gitignore"
+    gi = _safe_read_text(gitignore) if gitignore.exists() else ""
+    if ".env" in gi:
+        return None
+
+    return Finding(
+        "RISK",
+        ".env may be tracked",
+        "Project has .env but .gitignore does not mention it.",
+        str(env_file),
+        rule=RULE_ENV_GITIGNORE,
+    )
+
+
+# --------------------------------------------------
+# In-memory API
+# --------------------------------------------------
+# Satır içindeki satır sonu karakterleri, birleştirilmiş metinde ek satır
+# sayılmasın diye boşluğa çevrilir
+_BREAK_TO_SPACE = str.maketrans({c: " " for c in _BREAK_CHARS})
+
+
+def scan_lines(
+    path: str,
+    lines: Iterable[tuple[int, str]],
+    mode: str = SCAN_DEV,
+    config: ConfigSnapshot | None = None,
+    engine: RuleEngine | None = None,
+) -> list[Finding]:
+    """
+    Dosyanın sadece verilen satırlarını tarar: (satır no, metin) çiftleri,
+    ör. staged diff'te eklenen satırlar. Bulgular verilen satır
+    numaralarıyla döner. Dosya okunmaz; dosya seviyesindeki ignore
+    marker'ı sadece verilen satırlara bakar. Uzantı/ignore filtresi
+    çağıranın işi (is_scan_candidate, repo köküne göre path ile).
+    """
+    cfg = config if config is not None else config_snapshot()
+
+    numbers: list[int] = []
+    texts: list[str] = []
+    for lineno, text in lines:
+        numbers.append(lineno)
+        texts.append(text.translate(_BREAK_TO_SPACE))
+    if not texts:
+        return []
+
+    text = "\n".join(texts)
+    if IGNORE_FILE_MARKER in text:
+        return []
+
+    if engine is None:
+        engine = build_engine(TEXT_EXTS)
+
+    findings = _scan_text(
+        text,
+        path,
+        mode,
+        tuple(cfg.get("ignore_inline_markers", [])),
+        engine,
+        max_line=int(cfg.get("scan_max_line_chars", MAX_LINE_CHARS)),
+    ) or []
+
+    for f in findings:
+        f.line = numbers[f.line - 1]
+    return findings
+
+
+def scan_bytes(
+    path: str,
+    data: bytes,
+    mode: str = SCAN_DEV,
+    config: ConfigSnapshot | None = None,
+    engine: RuleEngine | None = None,
+) -> list[Finding]:
+    """
+    Diskte olmayan bir dosya içeriğini (ör. git'teki staged blob) tam
+    taramadaki gibi tarar: sniff, encoding, ignore marker, kurallar.
+    path sadece kural seçimi ve bulgularda kullanılır; uzantı/ignore
+    filtresi çağıranın işi (scan_lines gibi).
+    """
+    cfg = config if config is not None else config_snapshot()
+
+    if engine is None:
+        engine = build_engine(TEXT_EXTS)
+
+    return _scan_data(
+        data,
+        path,
+        mode,
+        tuple(cfg.get("ignore_inline_markers", [])),
+        engine,
+        int(cfg.get("scan_max_line_chars", MAX_LINE_CHARS)),
+    ).findings
 
 
 # --------------------------------------------------
 # Main scanner
 # --------------------------------------------------
-def scan_project(
+def iter_findings(
     root: str,
     mode: str = SCAN_DEV,
     only_files: list[str] | None = None,
-) -> list[Finding]:
-
-    cfg = load_config()
+    stats: ScanStats | None = None,
+    config: ConfigSnapshot | None = None,
+    cancel: threading.Event | None = None,
+    caches: dict | None = None,
+    on_progress: Callable[[dict], None] | None = None,
+) -> Iterator[Finding]:
+    """
+    Bulguları dosyalar tamamlandıkça (sırasız) yield eder.
+    Erken bırakılırsa (ör. ilk RISK'te close()) bekleyen worker işleri
+    iptal edilir ve o ana kadar taranan dosyalar cache'e yazılır.
+    stats verilirse tarama istatistikleriyle doldurulur.
+    config: tarama boyunca kullanılacak snapshot (verilmezse güncel olan).
+    cancel: set edilirse tarama bir sonraki dosyada ScanCancelled ile
+    durur; bekleyen worker işleri iptal edilir, taranan kısım cache'e yazılır.
+    caches: bellekte tutulacak ScanCache'ler (bkz. _open_cache).
+    on_progress: progress olayları ipc yerine buraya verilir (scan_daemon
+    bunları socket üzerinden istemciye aktarır).
+    """
+    cfg = config if config is not None else config_snapshot()
 
     ignore_markers = tuple(cfg.get("ignore_inline_markers", []))
-    progress_steps = cfg.get("scan_progress_steps", [20, 50, 80, 100])
     show_progress = cfg.get("show_scan_progress", True)
 
     rootp = Path(root).expanduser().resolve()
-    findings: list[Finding] = []
 
     if not rootp.exists() or not rootp.is_dir():
-        return findings
+        return
+
+    if stats is None:
+        stats = ScanStats()
 
     # --------------------------------------------------
     # File iterator
     # --------------------------------------------------
     if only_files:
-        file_iter = [Path(p) for p in only_files if Path(p).is_file()]
+        file_iter = _iter_only_files(only_files, rootp, cfg)
     else:
-        file_iter = list(rootp.rglob("*"))
+        file_iter = _walk_files(rootp, cfg)
 
-    total_files = len(file_iter) or 1
-    next_progress_index = 0
+    counts = {"RISK": 0, "TODO": 0, "INFO": 0}
 
-    def update_progress(done: int):
-        nonlocal next_progress_index
-        if not show_progress:
-            return
-        percent = int((done / total_files) * 100)
-        if next_progress_index < len(progress_steps):
-            if percent >= progress_steps[next_progress_index]:
-                _emit_progress(progress_steps[next_progress_index], mode)
-                next_progress_index += 1
+    def emit(f: Finding) -> Finding:
+        counts[f.kind] = counts.get(f.kind, 0) + 1
+        return f
 
     # --------------------------------------------------
     # 1️⃣ .env git ignore check
     # --------------------------------------------------
-    if cfg.get("ignore_env", True):
-        env_file = rootp / ".env"
-        if env_file.exists():
-            gitignore = rootp / ".gitignore"
-            gi = _safe_read_text(gitignore) if gitignore.exists() else ""
-            if ".env" not in gi:
-                findings.append(Finding(
-                    "RISK",
-                    ".env may be tracked",
-                    "Project has .env but .gitignore does not mention it.",
-                    str(env_file),
-                ))
+    env_finding = check_env_gitignore(rootp, cfg)
+    if env_finding is not None:
+        yield emit(env_finding)
 
     # --------------------------------------------------
     # 2️⃣ File scanning
     # --------------------------------------------------
-    for idx, p in enumerate(file_iter, start=1):
-        update_progress(idx)
+    candidates: list[FileEntry] = []
+    for entry in file_iter:
+        if cancel is not None and cancel.is_set():
+            raise ScanCancelled()
+        candidates.append(entry)
+    stats.files_total = len(candidates)
 
-        if p.is_dir():
-            continue
-        if _is_ignored_dir(p, cfg):
-            continue
-        if p.suffix.lower() not in TEXT_EXTS:
-            continue
+    progress = ProgressReporter(
+        mode,
+        rootp,
+        files_total=len(candidates),
+        bytes_total=sum(e.size for e in candidates),
+        counts=counts,
+        interval=float(cfg.get("scan_progress_interval", 0.25)),
+        enabled=show_progress,
+        sink=on_progress,
+    )
 
-        text = _safe_read_text(p)
-        if not text:
-            continue
+    # Değişmemiş dosyalar cache'ten, sadece dirty olanlar taranır
+    engine = build_engine(TEXT_EXTS)
+    max_line = int(cfg.get("scan_max_line_chars", MAX_LINE_CHARS))
+    cache = _open_cache(rootp, mode, ignore_markers, engine, max_line, cfg, caches)
+    completed = False
 
-        if IGNORE_FILE_MARKER in text:
-            continue
+    try:
+        dirty: list[FileEntry] = []
 
-        lines = text.splitlines()
+        for entry in candidates:
+            if cancel is not None and cancel.is_set():
+                raise ScanCancelled()
 
-        # ----------------------------------------------
-        # TODO / FIXME
-        # ----------------------------------------------
-        for i, line in enumerate(lines, start=1):
-            low = line.lower()
-            if any(m in low for m in ignore_markers):
+            rows = cache.lookup(*entry) if cache else None
+            if rows is None:
+                dirty.append(entry)
                 continue
 
-            if "todo" in low or "fixme" in low:
-                findings.append(Finding(
-                    "TODO",
-                    "TODO/FIXME found",
-                    line.strip()[:240],
-                    str(p),
-                    line=i,
-                ))
-
-        # ----------------------------------------------
-        # PHP specific checks
-        # ----------------------------------------------
-        if p.suffix.lower() == ".php":
-            for i, line in enumerate(lines, start=1):
-                low = line.lower()
-                if any(m in low for m in ignore_markers):
-                    continue
+            stats.files_cached += 1
+            progress.advance(entry, scanned=False)
+            for kind, title, detail, line, rule in rows:
+                yield emit(Finding(kind, title, detail, entry.path, line=line, rule=rule))
 
-                for pat in SECRET_PATTERNS:
-                    if pat.search(line):
-                        severity = "RISK" if mode == SCAN_PROD else "INFO"
-                        findings.append(Finding(
-                            severity,
-                            "Hardcoded secret",
-                            line.strip()[:240],
-                            str(p),
-                            line=i,
-                        ))
-                        break
-
-                if EMAIL_PATTERN.search(line):
-                    if ".env" not in p.name.lower():
-                        findings.append(Finding(
-                            "INFO",
-                            "Hardcoded email",
-                            line.strip()[:240],
-                            str(p),
-                            line=i,
-                        ))
-
-                if "display_errors" in low and "ini_set" in low:
-                    severity = "RISK" if mode == SCAN_PROD else "INFO"
-                    findings.append(Finding(
-                        severity,
-                        "display_errors enabled",
-                        line.strip()[:240],
-                        str(p),
-                        line=i,
-                    ))
+        scan_file = partial(
+            _scan_file,
+            mode=mode,
+            ignore_markers=ignore_markers,
+            engine=engine,
+            in_memory_limit=int(cfg.get("scan_in_memory_limit", IN_MEMORY_LIMIT)),
+            chunk_bytes=int(cfg.get("scan_chunk_bytes", CHUNK_BYTES)),
+            max_line=max_line,
+        )
 
-                if "error_reporting" in low and "e_all" in low:
-                    severity = "RISK" if mode == SCAN_PROD else "INFO"
-                    findings.append(Finding(
-                        severity,
-                        "error_reporting(E_ALL)",
-                        line.strip()[:240],
-                        str(p),
-                        line=i,
-                    ))
+        results = _map_files(scan_file, dirty, cfg)
+        for entry, (file_findings, prefiltered, file_class) in zip(dirty, results):
+            if cancel is not None and cancel.is_set():
+                results.close()         # kuyruktaki worker işlerini iptal et
+                raise ScanCancelled()
 
-        # ----------------------------------------------
-        # Large file warning
-        # ----------------------------------------------
-        try:
-            size = p.stat().st_size
-            if size > 700_000:
-                findings.append(Finding(
-                    "INFO",
-                    "Large file",
-                    f"File is {size / 1024:.0f} KB",
-                    str(p),
-                ))
-        except Exception:
-            pass
+            stats.files_scanned += 1
+            stats.prefilter_rejected += prefiltered
+            stats.binary_skipped += file_class == FILE_BINARY
+            stats.utf16_decoded += file_class == FILE_UTF16
+            stats.minified_capped += file_class == FILE_MINIFIED
+            progress.advance(entry)
+
+            if cache:
+                cache.store(
+                    *entry,
+                    [(f.kind, f.title, f.detail, f.line, f.rule) for f in file_findings],
+                )
+
+            for f in file_findings:
+                yield emit(f)
+
+        completed = True
+
+    finally:
+        if cache:
+            cache.save(prune=completed and not only_files)
 
     # --------------------------------------------------
     # Final progress
     # --------------------------------------------------
-    if show_progress:
-        _emit_progress(100, mode)
+    progress.finish(stats)
 
-    # --------------------------------------------------
-    # Sort results
-    # --------------------------------------------------
-    priority = {"RISK": 0, "TODO": 1, "INFO": 2}
-    findings.sort(key=lambda f: (priority.get(f.kind, 9), f.path, f.line or 0))
 
+def scan_project(
+    root: str,
+    mode: str = SCAN_DEV,
+    only_files: list[str] | None = None,
+    stats: ScanStats | None = None,
+    config: ConfigSnapshot | None = None,
+    cancel: threading.Event | None = None,
+) -> FindingStore:
+    """
+    Tüm bulguları toplayıp RISK → TODO → INFO, path, line sırasıyla döner.
+    Sonuç kompakt bir FindingStore'dur; list[Finding] gibi okunur.
+    """
+    findings = FindingStore(
+        iter_findings(root, mode, only_files, stats, config, cancel)
+    )
+    findings.sort()
     return findings
@@ -0,0 +1,113 @@
+import subprocess
+
+import pytest
+
+import git_changed
+from git_changed import (
+    _unquote_path,
+    iter_staged_added_lines,
+    iter_staged_blobs,
+    read_index,
+    staged_files_containing,
+)
+
+
+def test_staged_added_lines_ignore_user_diff_config(git_repo):
+    # Kullanıcı config'i header prefix'lerini ve path quoting'i değiştirmemeli
+    git_repo.git("config", "diff.mnemonicPrefix", "true")
+    git_repo.write("old.php", "one\ntwo\nthree\nfour\nfive\n")
+    git_repo.write("keep.php", "a\n")
+    git_repo.git("add", ".")
+    git_repo.git("commit", "-qm", "init")
+
+    git_repo.git("mv", "old.php", "new.php")
+    git_repo.write("new.php", "one\ntwo\nthree\nfour\nfive\n$token = 1;\n")
+    git_repo.write("keep.php", "a\nb\n")
+    git_repo.write('tab\tand "quote".php', "x\n")
+    git_repo.write("dir/ü.php", "é\n")
+    git_repo.git("add", "-A")
+
+    assert dict(iter_staged_added_lines(str(git_repo.path))) == {
+        "keep.php": [(2, "b")],
+        "new.php": [(6, "$token = 1;")],
+        'tab\tand "quote".php': [(1, "x")],
+        "dir/ü.php": [(1, "é")],
+    }
+
+
+def test_unquote_path():
+    assert _unquote_path(b'"tab\\tand \\"quote\\".php"') == b'tab\tand "quote".php'
+    assert _unquote_path(b'"dir/\\303\\274.php"') == "dir/ü.php".encode("utf-8")
+    assert _unquote_path(b"plain.php") == b"plain.php"
+
+
+@pytest.mark.parametrize("version", [2, 3, 4])
+def test_read_index_matches_ls_files(git_repo, version):
+    git_repo.write("a.php", "a\n")
+    git_repo.write("dir/ü.php", "b\n")
+    git_repo.write("dir/sub/c.php", "c\n")
+    git_repo.git("add", ".")
+    git_repo.write("later.php", "x\n")
+    git_repo.git("add", "-N", "later.php")       # v3+: extended flags
+    git_repo.git("update-index", f"--index-version={version}")
+
+    out = subprocess.run(
+        ["git", "-C", str(git_repo.path), "-c", "core.quotePath=false", "ls-files", "-s", "-z"],
+        capture_output=True, check=True,
+    ).stdout.decode()
+    expected = {}
+    for rec in filter(None, out.split("\0")):
+        meta, path = rec.split("\t", 1)
+        mode, sha, _stage = meta.split()
+        expected[path] = (int(mode, 8), sha)
+
+    index = read_index(str(git_repo.path))
+    assert {p: (e.mode, e.sha) for p, e in index.items()} == expected
+
+
+def test_staged_blobs_skip_unstaged_and_deleted(git_repo):
+    git_repo.write("same.php", "s\n")
+    git_repo.write("gone.php", "g\n")
+    git_repo.write("edit.php", "e\n")
+    git_repo.git("add", ".")
+    git_repo.git("commit", "-qm", "init")
+
+    git_repo.git("rm", "-q", "gone.php")
+    git_repo.write("edit.php", "e\nstaged\n")
+    git_repo.git("add", "edit.php")
+    git_repo.write("edit.php", "e\nstaged\nworktree only\n")
+    git_repo.write("same.php", "s\nnot staged\n")
+
+    index = read_index(str(git_repo.path))
+    assert list(iter_staged_blobs(str(git_repo.path))) == [("edit.php", index["edit.php"].sha)]
+
+
+def test_read_index_fails_closed_on_sha256(tmp_path):
+    repo = tmp_path / "repo"
+    r = subprocess.run(
+        ["git", "init", "-q", "--object-format=sha256", str(repo)], capture_output=True
+    )
+    if r.returncode != 0:
+        pytest.skip("git without sha256 support")
+    (repo / "a.php").write_text('$password = "x";\n$token = "y";\n', encoding="utf-8")
+    subprocess.run(["git", "-C", str(repo), "add", "."], check=True)
+
+    assert read_index(str(repo)) is None
+    # Staged blob'lar git'e düşülerek yine bulunur (tarama atlanmaz)
+    assert [p for p, _ in iter_staged_blobs(str(repo))] == ["a.php"]
+
+
+def test_staged_files_containing_literal_paths_and_batches(git_repo, monkeypatch):
+    monkeypatch.setattr(git_changed, "PATHSPEC_BATCH_CHARS", 20)
+    git_repo.write("a[1].php", "@zinkx-ignore-security\n")
+    git_repo.write("a1.php", "clean\n")
+    git_repo.write("star*.php", "clean\n")
+    git_repo.write("starX.php", "@zinkx-ignore-security\n")
+    git_repo.write("dir/long-name-3.php", "@zinkx-ignore-security\n")
+    git_repo.git("add", ".")
+
+    paths = ["a[1].php", "a1.php", "star*.php", "dir/long-name-3.php"]
+    assert staged_files_containing(str(git_repo.path), "@zinkx-ignore-security", paths) == {
+        "a[1].php",
+        "dir/long-name-3.php",
+    }
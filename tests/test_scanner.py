@@ -0,0 +1,166 @@
+import os
+import re
+from collections import Counter
+
+import pytest
+
+import config
+import scanner
+from config import ConfigSnapshot
+from rules import build_engine
+from scanner import SCAN_DEV, SCAN_PROD, TEXT_EXTS, scan_project
+
+
+MARKERS = ("zinkx-ignore", "ignore-security", "safe")
+
+# Eski, satır satır çalışan tarayıcının (splitlines + lower) birebir kopyası:
+# yeni tek geçişli motor bununla aynı bulguları vermeli.
+_SECRET_PATTERNS = [
+    re.compile(r"(api[_-]?key|secret|token|password)\s*=\s*['\"][^'\"]+['\"]", re.I),
+    re.compile(r"(api[_-]?key|secret|token|password)\s*:\s*['\"][^'\"]+['\"]", re.I),
+]
+_EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+
+
+def _reference_scan(name, text, mode):
+    if scanner.IGNORE_FILE_MARKER in text:
+        return []
+
+    found = []
+    sev = "RISK" if mode == SCAN_PROD else "INFO"
+    php = name.lower().endswith(".php")
+
+    for i, line in enumerate(text.splitlines(), start=1):
+        low = line.lower()
+        if any(m in low for m in MARKERS):
+            continue
+        detail = line.strip()[:240]
+
+        if "todo" in low or "fixme" in low:
+            found.append(("TODO", "TODO/FIXME found", detail, i))
+        if not php:
+            continue
+        if any(p.search(line) for p in _SECRET_PATTERNS):
+            found.append((sev, "Hardcoded secret", detail, i))
+        if _EMAIL_PATTERN.search(line) and ".env" not in name.lower():
+            found.append(("INFO", "Hardcoded email", detail, i))
+        if "display_errors" in low and "ini_set" in low:
+            found.append((sev, "display_errors enabled", detail, i))
+        if "error_reporting" in low and "e_all" in low:
+            found.append((sev, "error_reporting(E_ALL)", detail, i))
+
+    return found
+
+
+def _snapshot(**overrides):
+    return ConfigSnapshot(config._merge_with_defaults({
+        "scan_workers": 1,
+        "scan_cache": False,
+        "show_scan_progress": False,
+        "ignore_env": False,
+        "ignore_inline_markers": list(MARKERS),
+        **overrides,
+    }))
+
+
+def _as_rows(findings):
+    return Counter(
+        (f.kind, f.title, f.detail, f.line) for f in findings
+    )
+
+
+_BODY = [
+    "<?php",
+    "$token = 'abc'; // TODO rotate",
+    "$password: \"hunter2\"",
+    "$mail = 'dev@example.com';",
+    "ini_set('display_errors', 1);",
+    "error_reporting(E_ALL);",
+    "// fixme later",
+    "$apiKey = 'k'; // zinkx-ignore",
+    "$secret = 'x'; // SAFE",
+    "echo 'nothing here';",
+    "",
+    "  TODO trailing spaces   ",
+]
+
+CASES = {
+    "lf": "\n".join(_BODY) + "\n",
+    "crlf": "\r\n".join(_BODY) + "\r\n",
+    "cr": "\r".join(_BODY),
+    "mixed": "\n".join(_BODY[:4]) + "\r\n" + "\r".join(_BODY[4:8]) + "\n\n" + "\r\n".join(_BODY[8:]),
+    "exotic": "\x0b".join(_BODY[:3]) + "\x0c" + "\x1c".join(_BODY[3:5]) + "\x1d"
+              + "\x1e".join(_BODY[5:7]) + "\x85" + "\u2028".join(_BODY[7:10])
+              + "\u2029" + "\n".join(_BODY[10:]),
+    "casefold": "\n".join([
+        "<?php",
+        "// İİİ TODO after dotted capital I",
+        "$ſecret = 'long s';",
+        "$TOKEN = 'ı'; // İ",
+        "$tokın = 'dotless';",
+        "İİ ini_set('DISPLAY_ERRORS', 1);",
+        "// İ zinkx-ignore TODO",
+        "ſafe TODO",
+        "ERROR_REPORTİNG(E_ALL); error_reporting(e_all);",
+        "İ" * 50 + " fixme " + "ı" * 50,
+    ]) + "\n",
+}
+
+
+@pytest.mark.parametrize("mode", [SCAN_DEV, SCAN_PROD])
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_scan_project_matches_line_by_line_reference(tmp_path, case, mode):
+    text = CASES[case]
+    for name in ("a.php", "b.js", "config.env.php"):
+        (tmp_path / name).write_bytes(text.encode("utf-8"))
+
+    findings = scan_project(str(tmp_path), mode, config=_snapshot())
+
+    for name in ("a.php", "b.js", "config.env.php"):
+        got = [f for f in findings if os.path.basename(f.path) == name]
+        assert _as_rows(got) == Counter(_reference_scan(name, text, mode)), name
+
+
+def test_scan_project_skips_file_marker(tmp_path):
+    (tmp_path / "a.php").write_text(
+        "<?php\r// TODO\r// @zinkx-ignore-security\r$token = 'x';\r", encoding="utf-8"
+    )
+    (tmp_path / "b.php").write_text("// TODO\n", encoding="utf-8")
+
+    findings = scan_project(str(tmp_path), SCAN_DEV, config=_snapshot())
+
+    assert [(os.path.basename(f.path), f.line) for f in findings] == [("b.php", 1)]
+
+
+def _large_text():
+    # Tüm satır sonu türleri, parça sınırlarının her yere denk gelmesi için
+    # farklı uzunluklarda satırlar arasına dağıtılır
+    breaks = ["\n", "\r\n", "\r", "\x0b", "\x0c", "\x1c", "\x85", "\u2028", "\u2029"]
+    lines = []
+    for i in range(400):
+        pad = "ı" * (i % 37)
+        if i % 3 == 0:
+            lines.append(f"// TODO {i} {pad}")
+        elif i % 5 == 0:
+            lines.append(f"$token = '{i}'; {pad} // safe")
+        elif i % 7 == 0:
+            lines.append(f"$password = '{pad}{i}';")
+        else:
+            lines.append(f"echo {i}; {pad}")
+        lines.append(breaks[i % len(breaks)])
+    return "".join(lines)
+
+
+@pytest.mark.parametrize("chunk_bytes", [7, 64, 333, 4096, 1 << 20])
+def test_large_file_line_numbers_do_not_depend_on_chunk_size(tmp_path, chunk_bytes):
+    text = _large_text()
+    path = tmp_path / "big.php"
+    path.write_bytes(text.encode("utf-8"))
+    engine = build_engine(TEXT_EXTS)
+
+    skip, findings = scanner._scan_large_file(
+        str(path), SCAN_PROD, MARKERS, engine, chunk_bytes
+    )
+
+    assert not skip
+    assert _as_rows(findings) == Counter(_reference_scan("big.php", text, SCAN_PROD))